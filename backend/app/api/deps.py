@@ -18,59 +18,108 @@ Example Usage:
     ```
 """
 
-from typing import Annotated
-from fastapi import Depends
+from typing import Annotated, Dict, FrozenSet
+from fastapi import Depends, HTTPException, Request, status
 from app.db.base import InMemoryDB
+from app.services.base_service import BaseService
 from app.services.user_service import UserService
 from app.services.order_service import OrderService
 
 
-def get_memory_db() -> InMemoryDB:
+# Shared instances resolved once at import time. InMemoryDB is already a
+# singleton, and the services only hold per-table caches, so every request
+# and the startup seeding in app.main use these same instances.
+DB = InMemoryDB()
+USER_SERVICE = UserService(DB)
+ORDER_SERVICE = OrderService(DB)
+
+# Dispatch table for table-level routes: {table_name: service}
+_TABLE_SERVICES: Dict[str, BaseService] = {
+    "users": USER_SERVICE,
+    "orders": ORDER_SERVICE,
+}
+# Names of the tables exposed through the API
+TABLE_NAMES: FrozenSet[str] = frozenset(_TABLE_SERVICES)
+
+
+async def get_memory_db(request: Request) -> InMemoryDB:
     """
     Get the InMemoryDB instance.
 
-    The singleton pattern is implemented in the InMemoryDB class itself,
-    ensuring only one database instance exists throughout the application.
+    The application stores the shared database on ``app.state.db`` when it is
+    created, so the instance is handed out by reference rather than looked up
+    again through the singleton on every request.
+
+    Args:
+        request: The incoming request, used to reach the application state
 
     Returns:
         InMemoryDB: The singleton database instance
     """
-    return InMemoryDB()
+    db: InMemoryDB = request.app.state.db
+    return db
 
 
-def get_user_service() -> UserService:
+async def get_user_service() -> UserService:
     """
     Dependency provider for UserService instances.
 
-    This factory function:
-    1. Creates a new UserService instance for each request
-    2. Injects the singleton database dependency
-    3. Ensures proper service isolation
-    4. Enables easier testing through dependency injection
+    This provider:
+    1. Returns the shared UserService instance created at import time
+    2. Is declared async so FastAPI resolves it inline on the event loop
+       instead of dispatching it to the thread pool
+    3. Enables easier testing through dependency injection
 
     Returns:
-        UserService: A new service instance with injected dependencies
+        UserService: The shared service instance
     """
-    return UserService(get_memory_db())
+    return USER_SERVICE
 
 
-def get_order_service() -> OrderService:
+async def get_order_service() -> OrderService:
     """
     Dependency provider for OrderService instances.
 
-    This factory function:
-    1. Creates a new UserService instance for each request
-    2. Injects the singleton database dependency
-    3. Ensures proper service isolation
-    4. Enables easier testing through dependency injection
+    This provider:
+    1. Returns the shared OrderService instance created at import time
+    2. Is declared async so FastAPI resolves it inline on the event loop
+       instead of dispatching it to the thread pool
+    3. Enables easier testing through dependency injection
 
     Returns:
-        OrderService: A new service instance with injected dependencies
+        OrderService: The shared service instance
+    """
+    return ORDER_SERVICE
+
+
+async def get_table_service(table_name: str) -> BaseService:
+    """
+    Dependency provider resolving a table name to the service that owns it.
+
+    A single dict probe replaces the per-route ``if/elif`` chains on the table
+    name, and supporting a new table only requires registering its service.
+
+    Args:
+        table_name: Name of the table taken from the request path
+
+    Returns:
+        BaseService: The service responsible for the table
+
+    Raises:
+        HTTPException: If the table name is not known
     """
-    return OrderService(get_memory_db())
+    service = _TABLE_SERVICES.get(table_name)
+    if service is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Table {table_name} not found",
+        )
+    return service
 
 
 # Type-annotated dependencies for FastAPI
 # These provide type-safe dependency injection in route handlers
+MemoryDBDep = Annotated[InMemoryDB, Depends(get_memory_db)]
 UserServiceDep = Annotated[UserService, Depends(get_user_service)]
 OrderServiceDep = Annotated[OrderService, Depends(get_order_service)]
+TableServiceDep = Annotated[BaseService, Depends(get_table_service)]
@@ -0,0 +1,87 @@
+"""
+Conditional GET support for table reads.
+
+A table read is fully determined by the table's version counter and the
+request parameters, so that pair makes a strong ETag: it stays valid until
+the next write to the table. Encoded bodies are kept under the same key, so
+repeated reads of an unchanged page skip validation and JSON encoding, and
+clients that already hold the page get a bodiless 304. Single records get
+their own body cache, so a client walking through record IDs cannot evict
+the cached list pages.
+"""
+
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict
+from uuid import uuid4
+
+from fastapi import Request, Response, status
+
+# Table versions restart with the process, so tag ETags with a per-process ID
+# to keep a client from matching a page cached from a previous run
+_BOOT_ID = uuid4().hex[:8]
+
+# Clients may keep the body but must revalidate before every reuse, so they
+# never serve a stale page after their own write; unchanged data still costs
+# only a 304
+CACHE_CONTROL = "private, no-cache"
+MAX_CACHED_BODIES = 64
+
+# Encoded response bodies keyed by ETag, least recently used first: list
+# pages and dumps in one cache, single records in another
+_bodies: "OrderedDict[str, bytes]" = OrderedDict()
+_record_bodies: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def table_etag(table: str, version: int, *params: object) -> str:
+    """Build the ETag for a read of ``table`` at ``version`` with ``params``."""
+    return '"' + "-".join(map(str, (_BOOT_ID, table, version, *params))) + '"'
+
+
+def _cache_headers(etag: str) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def _client_has(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    # If-None-Match uses weak comparison (RFC 9110), so a validator that a
+    # proxy weakened to W/"..." still matches
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+async def conditional_json(
+    request: Request,
+    etag: str,
+    render: Callable[[], Awaitable[bytes]],
+    *,
+    single_record: bool = False,
+) -> Response:
+    """
+    Answer a GET from the client's cache, the body cache or ``render``.
+
+    Args:
+        request: Incoming request, checked for a matching If-None-Match
+        etag: ETag of the current representation (see table_etag)
+        render: Builds the JSON body; only awaited on a body cache miss
+        single_record: Cache the body with the single records instead of
+            the list pages
+
+    Returns:
+        Response: 304 if the client is up to date, otherwise the JSON body
+    """
+    headers = _cache_headers(etag)
+    if _client_has(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    bodies = _record_bodies if single_record else _bodies
+    body = bodies.get(etag)
+    if body is None:
+        body = await render()
+        bodies[etag] = body
+        if len(bodies) > MAX_CACHED_BODIES:
+            bodies.popitem(last=False)
+    else:
+        bodies.move_to_end(etag)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,6 +1,5 @@
 from fastapi import APIRouter
 from app.api.v1 import tables, utils
-from typing import Dict
 
 # Create API router
 api_router = APIRouter()
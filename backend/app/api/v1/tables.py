@@ -11,19 +11,70 @@ This module provides REST endpoints for:
 All routes use dependency injection for services and follow REST best practices.
 """
 
-from typing import Dict, Sequence, Union, List
+from typing import Annotated, Dict, List, Literal
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, status, Path
-
-from app.api.deps import UserServiceDep, OrderServiceDep
-from app.db.base import RecordNotFoundError, InMemoryDB
+import orjson
+from fastapi import (
+    APIRouter,
+    Body,
+    HTTPException,
+    Request,
+    Response,
+    status,
+    Path,
+    Query,
+)
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from app.api.deps import (
+    TABLE_NAMES,
+    MemoryDBDep,
+    UserServiceDep,
+    OrderServiceDep,
+    TableServiceDep,
+)
+from app.api.http_cache import conditional_json, table_etag
+from app.db.base import RecordNotFoundError
 from app.schemas.user import UserIn, UserOut, UsersOut, UserUpdate
 from app.schemas.order import OrderIn, OrderOut, OrdersOut, OrderUpdate
 
 
 router = APIRouter(prefix="/api/v1", tags=["v1"])
-db = InMemoryDB()
+
+# Pagination bounds for list endpoints, so a single request never encodes
+# an unbounded number of records
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+LimitQuery = Annotated[
+    int, Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of records")
+]
+OffsetQuery = Annotated[int, Query(ge=0, description="Number of records to skip")]
+
+# Upper bound on the number of items a single batch request may carry
+MAX_BATCH_SIZE = 1000
+
+
+def _encoded(page: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Encode an already validated response model.
+
+    List wrappers are built with model_construct from validated items, so
+    running them through FastAPI's response_model validation again would
+    only repeat that work; the declared response_model is kept for the docs.
+    """
+    return Response(
+        content=page.model_dump_json(),
+        media_type="application/json",
+        status_code=status_code,
+    )
+
+
+BatchIds = Annotated[
+    List[UUID], Body(min_length=1, max_length=MAX_BATCH_SIZE, description="Record IDs")
+]
 
 
 # User endpoints
@@ -49,11 +100,18 @@ async def create_user(user: UserIn, user_service: UserServiceDep) -> UserOut:
 
 
 @router.get("/users/{user_id}", response_model=UserOut)
-async def get_user(user_id: UUID, user_service: UserServiceDep) -> UserOut:
+async def get_user(
+    request: Request, user_id: UUID, user_service: UserServiceDep
+) -> Response:
     """
     Get a user by ID.
 
+    Like the list endpoints, the response carries an ETag derived from the
+    users table version, so unchanged users are answered with 304 or from
+    the encoded body cache.
+
     Args:
+        request: Incoming request, for conditional GET headers
         user_id: UUID of the user to retrieve
         user_service: Injected user service dependency
 
@@ -63,27 +121,57 @@ async def get_user(user_id: UUID, user_service: UserServiceDep) -> UserOut:
     Raises:
         HTTPException: If user is not found
     """
-    try:
-        return await user_service.get_user(user_id)
-    except RecordNotFoundError:
+    # Fetched before the conditional GET, so If-None-Match: * cannot turn
+    # a missing user into 304 Not Modified; render reuses the same record
+    record = await user_service.get(user_id)
+    if record is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"User {user_id} not found"
         )
 
+    async def render() -> bytes:
+        return UserOut(**record).model_dump_json().encode()
+
+    version = await user_service.version()
+    etag = table_etag(user_service.table_name, version, user_id)
+    return await conditional_json(request, etag, render, single_record=True)
+
 
 @router.get("/users", response_model=UsersOut)
-async def list_users(user_service: UserServiceDep) -> UsersOut:
+async def list_users(
+    request: Request,
+    user_service: UserServiceDep,
+    limit: LimitQuery = DEFAULT_PAGE_SIZE,
+    offset: OffsetQuery = 0,
+) -> Response:
     """
-    List all users.
+    List users one page at a time.
+
+    The page carries an ETag derived from the table version; a matching
+    If-None-Match gets 304 Not Modified, and the encoded page is reused
+    until the users table is written to.
 
     Args:
+        request: Incoming request, for conditional GET headers
         user_service: Injected user service dependency
+        limit: Maximum number of users to return
+        offset: Number of users to skip
 
     Returns:
-        UsersOut: List of users with count
+        UsersOut: Page of users with the total count
     """
-    users = await user_service.list_users()
-    return UsersOut(data=users, count=len(users))
+
+    async def render() -> bytes:
+        users = await user_service.list_users(offset=offset, limit=limit)
+        count = await user_service.count()
+        page = UsersOut.model_construct(
+            data=users, count=count, offset=offset, limit=limit
+        )
+        return page.model_dump_json().encode()
+
+    version = await user_service.version()
+    etag = table_etag(user_service.table_name, version, "list", offset, limit)
+    return await conditional_json(request, etag, render)
 
 
 @router.patch("/users/{user_id}", response_model=UserOut)
@@ -135,6 +223,69 @@ async def delete_user(user_id: UUID, user_service: UserServiceDep) -> bool:
         )
 
 
+# Batch user endpoints: one request pipeline for many records
+@router.post(
+    "/users:batchCreate", response_model=UsersOut, status_code=status.HTTP_201_CREATED
+)
+async def batch_create_users(
+    users: Annotated[List[UserIn], Body(min_length=1, max_length=MAX_BATCH_SIZE)],
+    user_service: UserServiceDep,
+) -> Response:
+    """
+    Create several users in one request.
+
+    Args:
+        users: User data for creation, at most MAX_BATCH_SIZE items
+        user_service: Injected user service dependency
+
+    Returns:
+        UsersOut: Created users with count
+
+    Raises:
+        HTTPException: If user creation fails
+    """
+    try:
+        created = await user_service.create_users(users)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    page = UsersOut.model_construct(data=created, count=len(created))
+    return _encoded(page, status.HTTP_201_CREATED)
+
+
+@router.post("/users:batchGet", response_model=UsersOut)
+async def batch_get_users(user_ids: BatchIds, user_service: UserServiceDep) -> Response:
+    """
+    Get several users by ID in one request.
+
+    The IDs are sent in the request body to avoid URL length limits.
+    IDs that do not exist are left out of the result.
+
+    Args:
+        user_ids: UUIDs of the users to retrieve
+        user_service: Injected user service dependency
+
+    Returns:
+        UsersOut: Users found with count
+    """
+    users = await user_service.get_users(user_ids)
+    return _encoded(UsersOut.model_construct(data=users, count=len(users)))
+
+
+@router.post("/users:batchDelete", response_model=int)
+async def batch_delete_users(user_ids: BatchIds, user_service: UserServiceDep) -> int:
+    """
+    Delete several users by ID in one request.
+
+    Args:
+        user_ids: UUIDs of the users to delete
+        user_service: Injected user service dependency
+
+    Returns:
+        int: Number of users deleted; IDs that do not exist are skipped
+    """
+    return await user_service.delete_users(user_ids)
+
+
 # Order endpoints
 @router.post("/orders", response_model=OrderOut, status_code=status.HTTP_201_CREATED)
 async def create_order(
@@ -154,25 +305,67 @@ async def create_order(
     Raises:
         HTTPException: If user not found or order creation fails
     """
-    try:
-        # Verify user exists
-        await user_service.get_user(order.user_id)
-        return await order_service.create_order(order)
-    except RecordNotFoundError:
+    # Verify user exists with a single probe instead of building a UserOut
+    if not await user_service.exists(order.user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"User {order.user_id} not found",
         )
+    try:
+        return await order_service.create_order(order)
     except Exception as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post(
+    "/orders:batchCreate", response_model=OrdersOut, status_code=status.HTTP_201_CREATED
+)
+async def batch_create_orders(
+    orders: Annotated[List[OrderIn], Body(min_length=1, max_length=MAX_BATCH_SIZE)],
+    order_service: OrderServiceDep,
+    user_service: UserServiceDep,
+) -> Response:
+    """
+    Create several orders in one request.
+
+    Args:
+        orders: Order data for creation, at most MAX_BATCH_SIZE items
+        order_service: Injected order service dependency
+        user_service: Injected user service dependency for validation
+
+    Returns:
+        OrdersOut: Created orders with count
+
+    Raises:
+        HTTPException: If any user is not found or order creation fails
+    """
+    # Verify every referenced user exists before creating anything
+    for user_id in {order.user_id for order in orders}:
+        if not await user_service.exists(user_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User {user_id} not found",
+            )
+    try:
+        created = await order_service.create_orders(orders)
+    except Exception as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    page = OrdersOut.model_construct(data=created, count=len(created))
+    return _encoded(page, status.HTTP_201_CREATED)
+
+
 @router.get("/orders/{order_id}", response_model=OrderOut)
-async def get_order(order_id: UUID, order_service: OrderServiceDep) -> OrderOut:
+async def get_order(
+    request: Request, order_id: UUID, order_service: OrderServiceDep
+) -> Response:
     """
     Get an order by ID.
 
+    The response carries an ETag derived from the orders table version, so
+    unchanged orders are answered with 304 or from the encoded body cache.
+
     Args:
+        request: Incoming request, for conditional GET headers
         order_id: UUID of the order to retrieve
         order_service: Injected order service dependency
 
@@ -182,41 +375,57 @@ async def get_order(order_id: UUID, order_service: OrderServiceDep) -> OrderOut:
     Raises:
         HTTPException: If order is not found
     """
-    try:
-        return await order_service.get_order(order_id)
-    except RecordNotFoundError:
+    # Fetched before the conditional GET, so If-None-Match: * cannot turn
+    # a missing order into 304 Not Modified; render reuses the same record
+    record = await order_service.get(order_id)
+    if record is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"Order {order_id} not found"
         )
 
+    async def render() -> bytes:
+        return OrderOut(**record).model_dump_json().encode()
+
+    version = await order_service.version()
+    etag = table_etag(order_service.table_name, version, order_id)
+    return await conditional_json(request, etag, render, single_record=True)
+
 
 @router.get("/users/{user_id}/orders", response_model=OrdersOut)
 async def get_user_orders(
-    user_id: UUID, user_service: UserServiceDep, order_service: OrderServiceDep
-) -> OrdersOut:
+    user_id: UUID,
+    user_service: UserServiceDep,
+    order_service: OrderServiceDep,
+    limit: LimitQuery = DEFAULT_PAGE_SIZE,
+    offset: OffsetQuery = 0,
+) -> Response:
     """
-    Get all orders for a user.
+    Get a user's orders one page at a time.
 
     Args:
         user_id: UUID of the user whose orders to retrieve
         user_service: Injected user service dependency for validation
         order_service: Injected order service dependency
+        limit: Maximum number of orders to return
+        offset: Number of orders to skip
 
     Returns:
-        OrdersOut: List of user's orders with count
+        OrdersOut: Page of the user's orders with the total count
 
     Raises:
         HTTPException: If user is not found
     """
-    try:
-        # Verify user exists
-        await user_service.get_user(user_id)
-        orders = await order_service.get_user_orders(user_id)
-        return OrdersOut(data=orders, count=len(orders))
-    except RecordNotFoundError:
+    # Verify user exists with a single probe instead of building a UserOut
+    if not await user_service.exists(user_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=f"User {user_id} not found"
         )
+    orders = await order_service.get_user_orders(user_id, offset=offset, limit=limit)
+    count = await order_service.count_user_orders(user_id)
+    page = OrdersOut.model_construct(
+        data=orders, count=count, offset=offset, limit=limit
+    )
+    return _encoded(page)
 
 
 @router.get("/orders/{order_id}/user", response_model=UserOut)
@@ -245,18 +454,38 @@ async def get_order_user(
 
 
 @router.get("/orders", response_model=OrdersOut)
-async def list_orders(order_service: OrderServiceDep) -> OrdersOut:
+async def list_orders(
+    request: Request,
+    order_service: OrderServiceDep,
+    limit: LimitQuery = DEFAULT_PAGE_SIZE,
+    offset: OffsetQuery = 0,
+) -> Response:
     """
-    List all orders.
+    List orders one page at a time.
+
+    Served with an ETag and cached body in the same way as list_users.
 
     Args:
+        request: Incoming request, for conditional GET headers
         order_service: Injected order service dependency
+        limit: Maximum number of orders to return
+        offset: Number of orders to skip
 
     Returns:
-        OrdersOut: List of orders with count
+        OrdersOut: Page of orders with the total count
     """
-    orders = await order_service.list_orders()
-    return OrdersOut(data=orders, count=len(orders))
+
+    async def render() -> bytes:
+        orders = await order_service.list_orders(offset=offset, limit=limit)
+        count = await order_service.count()
+        page = OrdersOut.model_construct(
+            data=orders, count=count, offset=offset, limit=limit
+        )
+        return page.model_dump_json().encode()
+
+    version = await order_service.version()
+    etag = table_etag(order_service.table_name, version, "list", offset, limit)
+    return await conditional_json(request, etag, render)
 
 
 @router.patch("/orders/{order_id}", response_model=OrderOut)
@@ -311,68 +540,84 @@ async def delete_order(order_id: UUID, order_service: OrderServiceDep) -> bool:
 
 
 # Generic table operations
-@router.get("/tables/{table_name}/dump", response_model=Dict[str, object])
+@router.get("/tables/{table_name}/dump", response_class=ORJSONResponse)
 async def dump_table(
+    request: Request,
     table_name: str,
-    user_service: UserServiceDep,
-    order_service: OrderServiceDep,
-    format: str = "json",
-) -> Dict[str, object]:
+    table_service: TableServiceDep,
+    format: Literal["json"] = "json",
+    limit: LimitQuery = DEFAULT_PAGE_SIZE,
+    offset: OffsetQuery = 0,
+) -> Response:
     """
-    Dump all records from a table.
+    Dump records from a table one page at a time.
 
     This endpoint is intended for debugging and development purposes.
     In production, it should be protected by appropriate authentication
     and authorization mechanisms.
 
+    Records are returned as stored (minus private fields) and encoded with
+    orjson, skipping Pydantic validation and the stdlib JSON encoder. Pages
+    are served with an ETag and cached body in the same way as list_users.
+
     Args:
+        request: Incoming request, for conditional GET headers
         table_name: Name of the table to dump (either "users" or "orders")
-        format: Output format (only "json" supported)
-        user_service: Injected user service dependency
-        order_service: Injected order service dependency
+        format: Output format (only "json" supported, enforced at parse time)
+        table_service: Injected service for the requested table
+        limit: Maximum number of records to return
+        offset: Number of records to skip
 
     Returns:
         Dict containing:
-            - data: List of records from the table
+            - data: Page of records from the table
             - count: Total number of records
+            - limit: Maximum number of records returned
+            - offset: Number of records skipped
 
     Raises:
         HTTPException: If operation fails or table name is invalid
     """
-    if format != "json":
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid format. Only 'json' is supported",
+
+    async def render() -> bytes:
+        data = await table_service.dump()
+        return orjson.dumps(
+            {
+                "data": data[offset : offset + limit],
+                "count": len(data),
+                "limit": limit,
+                "offset": offset,
+            }
         )
 
     try:
-        data: Sequence[Union[UserOut, OrderOut]]
-        if table_name == "users":
-            data = await user_service.list_users(bulk_mode=True)
-        elif table_name == "orders":
-            data = await order_service.list_orders(bulk_mode=True)
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Table {table_name} not found",
-            )
-
-        return {"data": data, "count": len(data)}
+        version = await table_service.version()
+        etag = table_etag(table_name, version, "dump", offset, limit)
+        return await conditional_json(request, etag, render)
     except Exception as e:
-        if isinstance(e, HTTPException):
-            raise e
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to dump table {table_name}: {str(e)}",
         )
 
 
-@router.get("/db/dump/{table_name}", response_model=List[Dict[str, object]])
-async def dump_table_raw(table_name: str = Path(...)) -> List[Dict[str, object]]:
+@router.get(
+    "/db/dump/{table_name}",
+    response_model=List[Dict[str, object]],
+    response_class=ORJSONResponse,
+)
+async def dump_table_raw(
+    db: MemoryDBDep, table_name: str = Path(...)
+) -> ORJSONResponse:
     """
     Dump all records from a table in raw format.
 
+    The records are returned in an ORJSONResponse, so FastAPI skips
+    validating them against the response model (which is kept for the
+    OpenAPI docs) and encodes them with orjson.
+
     Args:
+        db: Injected database dependency
         table_name: Name of the table to dump
 
     Returns:
@@ -381,24 +626,20 @@ async def dump_table_raw(table_name: str = Path(...)) -> List[Dict[str, object]]
     Raises:
         HTTPException: If table does not exist
     """
-    if not await db.table_exists(table_name):
+    # The set of tables is fixed, so check it locally instead of asking the DB
+    if table_name not in TABLE_NAMES:
         raise HTTPException(status_code=404, detail=f"Table {table_name} not found")
-    return await db.list_records(table_name)
+    return ORJSONResponse(await db.snapshot(table_name))
 
 
 @router.delete("/tables/{table_name}", response_model=bool)
-async def clear_table(
-    table_name: str,
-    user_service: UserServiceDep,
-    order_service: OrderServiceDep,
-) -> bool:
+async def clear_table(table_name: str, table_service: TableServiceDep) -> bool:
     """
     Clear all records from a table.
 
     Args:
         table_name: Name of the table to clear (either "users" or "orders")
-        user_service: Injected user service dependency
-        order_service: Injected order service dependency
+        table_service: Injected service for the requested table
 
     Returns:
         bool: True if table was cleared
@@ -407,19 +648,9 @@ async def clear_table(
         HTTPException: If table name is invalid
     """
     try:
-        if table_name == "users":
-            await user_service.clear_table()
-        elif table_name == "orders":
-            await order_service.clear_table()
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Table {table_name} not found",
-            )
+        await table_service.clear_table()
         return True
     except Exception as e:
-        if isinstance(e, HTTPException):
-            raise e
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to clear table {table_name}: {str(e)}",
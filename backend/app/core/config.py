@@ -1,16 +1,29 @@
 """Configuration settings for the application."""
 
-from pydantic import BaseModel
+import os
+
+from pydantic import BaseModel, ConfigDict
 
 
 class Settings(BaseModel):
     """Application settings."""
 
+    # Settings are shared process-wide and never change after startup
+    model_config = ConfigDict(frozen=True)
+
     API_V1_STR: str = "/api/v1"
     API_VERSION: str = "1.0.0"
     ENVIRONMENT: str = "development"
     DEBUG: bool = True
     BACKEND_CORS_ORIGINS: list[str] = ["http://localhost", "http://localhost:8000"]
+    # Seed the tables from the bundled sample data on startup; set
+    # LOAD_SAMPLE_DATA=0 to start empty without reading the JSON file
+    # (the production image does)
+    LOAD_SAMPLE_DATA: bool = os.getenv("LOAD_SAMPLE_DATA", "1").lower() in (
+        "1",
+        "true",
+        "yes",
+    )
     SERVICE_NAME: str = "In-Memory Database Service"
     SERVICE_VERSION: str = "1.0.0"
     SERVICE_DESCRIPTION: str = (
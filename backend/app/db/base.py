@@ -1,8 +1,66 @@
+import sys
 from collections import defaultdict
-from typing import Dict, List, Any, Optional, Set
-from asyncio import Lock
+from itertools import islice
+from types import MappingProxyType
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
 from uuid import UUID, uuid4
 
+# Stand-in for a table that has never been written to. Read paths look tables
+# up with .get() and fall back to this, so probing an unknown table or value
+# never inserts an empty entry into the defaultdicts behind the store.
+_NO_RECORDS: Mapping[int, Dict[str, Any]] = MappingProxyType({})
+_NO_INDEXES: Mapping[str, Dict[Any, Dict[UUID, None]]] = MappingProxyType({})
+_NO_IDS: FrozenSet[UUID] = frozenset()
+
+# Marks an indexed field that is absent from a record
+_MISSING = object()
+
+
+def _interned(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a record with its string values interned.
+
+    Low-cardinality values such as order statuses repeat across many records;
+    interning stores each distinct string once and lets index lookups match
+    on identity before comparing characters.
+    """
+    return {
+        field: sys.intern(value) if type(value) is str else value
+        for field, value in data.items()
+    }
+
+
+def _index(
+    field_index: Dict[Any, Dict[UUID, None]], value: Any, record_id: UUID
+) -> None:
+    """Add a record ID to the end of an index entry."""
+    entry = field_index.get(value)
+    if entry is None:
+        field_index[value] = {record_id: None}
+    else:
+        entry[record_id] = None
+
+
+def _unindex(
+    field_index: Dict[Any, Dict[UUID, None]], value: Any, record_id: UUID
+) -> None:
+    """Remove a record ID from an index entry, dropping the entry once empty."""
+    entry = field_index.get(value)
+    if entry is None:
+        return
+    entry.pop(record_id, None)
+    if not entry:
+        del field_index[value]
+
 
 class DatabaseError(Exception):
     """Base exception for database operations"""
@@ -24,25 +82,34 @@ class RecordNotFoundError(DatabaseError):
 
 class InMemoryDB:
     """
-    InMemoryDB implements the Singleton pattern with table-level locking and optimized indexing.
+    InMemoryDB implements the Singleton pattern with atomic writes and optimized indexing.
 
     Key Features:
     1. Singleton Pattern: Ensures only one database instance exists application-wide
-    2. Table-Level Locking: Each table has its own asyncio.Lock for write operations
+    2. Atomic Writes: Write operations contain no await points
     3. Concurrent Access:
-       - Write operations (create, update, delete) are protected by table-specific locks
-       - Read operations don't acquire locks, allowing concurrent reads
-       - Operations on different tables can proceed concurrently
-    4. Thread Safety: Asyncio locks ensure thread-safe access to table data
+       - The event loop runs one coroutine at a time and only switches at an
+         await, so a write (record plus index maintenance) always completes
+         before any other coroutine can observe the table
+       - No locks are taken, so writes never suspend and reads never wait
+       - Any future critical section that has to await must add its own lock
+    4. Copy-on-Write Records:
+       - Stored records are never mutated; an update stores a new dict
+       - Reads hand out the stored dicts without copying them, and a reader
+         keeps seeing the version it fetched even if the record is updated
+       - Callers must treat returned records as read-only
     5. Index Optimization:
        - Hash-based indexing for O(1) lookup time
        - Automatic index maintenance during CRUD operations
-       - Memory-efficient index storage using sets
+       - Entries are insertion-ordered ID sets (dicts with None values), so
+         adding or removing a record is O(1) and matches come back in the
+         order they were indexed
+       - Lookups hand out a frozenset snapshot of the entry
        - Transparent to service layer
        - Optimized for relationship queries (e.g., finding orders by user_id)
 
     Index Implementation:
-    - Structure: {table_name: {field_name: {field_value: set(record_ids)}}}
+    - Structure: {table_name: {field_name: {field_value: {record_id: None}}}}
     - Example:
       _indexes = {
           "orders": {
@@ -64,6 +131,12 @@ class InMemoryDB:
     _instance: Optional["InMemoryDB"] = None
     _initialized: bool = False
 
+    # Indexes maintained for every instance: {table_name: [field_name, ...]}
+    DEFAULT_INDEXES: Dict[str, List[str]] = {
+        "orders": ["user_id"],  # Orders are commonly queried by user_id
+        "users": ["email"],  # Users are commonly queried by email
+    }
+
     def __new__(cls) -> "InMemoryDB":
         """Controls instance creation to implement the Singleton pattern."""
         if cls._instance is None:
@@ -77,25 +150,42 @@ class InMemoryDB:
         
         Storage Structures:
         1. _storage: Main data store
-           - Format: {table_name: {record_id: record_data}}
+           - Format: {table_name: {record_id.int: record_data}}
            - Purpose: Primary storage for all records
+           - Keys are the UUID's 128-bit integer, which hashes in C instead
+             of going through the Python-level UUID.__hash__
         
-        2. _locks: Concurrency control
-           - Format: {table_name: asyncio.Lock()}
-           - Purpose: Table-level locking for thread safety
-        
-        3. _indexes: Hash-based indexing
-           - Format: {table_name: {field_name: {field_value: set(record_ids)}}}
+        2. _indexes: Hash-based indexing
+           - Format: {table_name: {field_name: {field_value: {record_id: None}}}}
            - Purpose: O(1) lookup time for indexed fields
            - Benefits: Fast relationship queries, efficient filtering
+
+        3. _versions: Table version counters
+           - Format: {table_name: version}
+           - Purpose: Bumped on every write so callers can cache derived data
+           - Benefits: Cheap invalidation check for read-heavy consumers
+
+        4. _snapshots: Read-only table snapshots
+           - Format: {table_name: (version, tuple(records))}
+           - Purpose: Shared by readers until the table version changes
+           - Benefits: Repeated full-table reads don't rebuild the record list
         """
         if not self._initialized:
-            # Main storage for table data: {table_name: {record_id: record_data}}
-            self._storage: Dict[str, Dict[UUID, Dict[str, Any]]] = defaultdict(dict)
-            # Table-level locks: {table_name: asyncio.Lock()}
-            self._locks: Dict[str, Lock] = defaultdict(Lock)
-            # Index storage: {table_name: {field_name: {field_value: set(record_ids)}}}
-            self._indexes: Dict[str, Dict[str, Dict[Any, Set[UUID]]]] = defaultdict(lambda: defaultdict(lambda: defaultdict(set)))
+            # Main storage for table data: {table_name: {record_id.int: record_data}}
+            self._storage: Dict[str, Dict[int, Dict[str, Any]]] = defaultdict(dict)
+            # Per-table write counters: {table_name: version}
+            self._versions: Dict[str, int] = defaultdict(int)
+            # Read-only table snapshots: {table_name: (version, records)}
+            self._snapshots: Dict[str, Tuple[int, Tuple[Dict[str, Any], ...]]] = {}
+            # Index storage: {table_name: {field_name: {field_value: {record_id: None}}}}
+            # Plain dicts: entries are only ever created explicitly by writes
+            # and create_index(), never as a side effect of a lookup
+            self._indexes: Dict[str, Dict[str, Dict[Any, Dict[UUID, None]]]] = {}
+            # Register the default indexes up front so they are maintained
+            # from the very first write, whether or not initialize() runs
+            for table, fields in self.DEFAULT_INDEXES.items():
+                for field in fields:
+                    self._indexes.setdefault(table, {})[field] = {}
             self._initialized = True
 
     async def initialize(self) -> None:
@@ -109,58 +199,53 @@ class InMemoryDB:
         The indexes are maintained automatically during all CRUD operations,
         providing O(1) lookup time for these fields without any service layer changes.
         """
-        # Create indexes for common relationship fields
-        common_indexes = {
-            "orders": ["user_id"],  # Orders are commonly queried by user_id
-            "users": ["email"]      # Users are commonly queried by email
-        }
-        
         # Initialize tables and indexes
-        for table, fields in common_indexes.items():
+        for table, fields in self.DEFAULT_INDEXES.items():
             # Initialize table storage if not exists
             if table not in self._storage:
                 self._storage[table] = {}
             
-            # Initialize table locks if not exists
-            if table not in self._locks:
-                self._locks[table] = Lock()
-            
             # Initialize indexes for each field
+            table_indexes = self._indexes.setdefault(table, {})
             for field in fields:
-                if table not in self._indexes:
-                    self._indexes[table] = {}
-                if field not in self._indexes[table]:
-                    self._indexes[table][field] = defaultdict(set)
+                table_indexes.setdefault(field, {})
 
     async def cleanup(self) -> None:
         """Clean up the database."""
         self._storage.clear()
-        self._locks.clear()
+        self._snapshots.clear()
+        # Bump rather than reset versions so cached data can never match again
+        for table in self._versions:
+            self._versions[table] += 1
+        # Drop index entries but keep the index definitions
+        for table_indexes in self._indexes.values():
+            for field_index in table_indexes.values():
+                field_index.clear()
 
     async def create_index(self, table: str, field: str) -> None:
         """
         Create an index on a specific field in a table.
         
         This method:
-        1. Acquires table lock for thread safety
-        2. Creates the index structure if it doesn't exist
-        3. Builds index for existing records
+        1. Creates the index structure if it doesn't exist
+        2. Builds index for existing records
         
         The index provides O(1) lookup time for queries on the indexed field.
         For example, indexing "user_id" in the orders table allows fast retrieval
         of all orders for a specific user without scanning the entire table.
         
-        Thread Safety:
-        - Uses table-level lock to ensure thread-safe index creation
-        - Safe for concurrent access from multiple coroutines
+        Atomicity:
+        - The build loop has no await, so no write can interleave with it
         """
-        async with self._locks[table]:
-            # Build index for existing records
-            for record_id, record in self._storage[table].items():
-                if field in record:
-                    self._indexes[table][field][record[field]].add(record_id)
+        field_index = self._indexes.setdefault(table, {}).setdefault(field, {})
+        # Build index for existing records, in table order
+        for key, record in self._storage.get(table, _NO_RECORDS).items():
+            if field in record:
+                _index(field_index, record[field], UUID(int=key))
 
-    async def get_by_index(self, table: str, field: str, value: Any) -> Set[UUID]:
+    async def get_by_index(
+        self, table: str, field: str, value: Any
+    ) -> FrozenSet[UUID]:
         """
         Get record IDs by indexed field value.
         
@@ -172,10 +257,54 @@ class InMemoryDB:
             Set of record IDs matching the field value
         
         Note:
-        - Returns a copy of the ID set to prevent external modifications
+        - Index entries are updated in place by writers, so the caller gets
+          a frozenset snapshot that later writes do not affect
         - No lock needed for reads, allowing concurrent access
+        - Misses do not create index entries
+        """
+        field_index = self._indexes.get(table, _NO_INDEXES).get(field)
+        if field_index is None:
+            return _NO_IDS
+        entry = field_index.get(value)
+        return _NO_IDS if entry is None else frozenset(entry)
+
+    async def count_by_index(self, table: str, field: str, value: Any) -> int:
+        """
+        Count records by indexed field value.
+
+        Reads the size of the index entry directly, so counting is O(1)
+        and does not copy the entry the way get_by_index does.
+
+        Returns:
+            Number of records matching the field value (0 if the field
+            is not indexed)
         """
-        return self._indexes[table][field][value].copy()
+        field_index = self._indexes.get(table, _NO_INDEXES).get(field)
+        if field_index is None:
+            return 0
+        return len(field_index.get(value, ()))
+
+    async def list_by(self, table: str, field: str, value: Any) -> List[Dict[str, Any]]:
+        """
+        List records whose field equals the given value.
+
+        For indexed fields this is a single hash probe followed by one storage
+        lookup per match, so the cost is O(k) in the number of results rather
+        than O(n) in the size of the table. Unindexed fields fall back to a
+        full scan.
+
+        Matches are returned in a stable order: table order for a scan, and
+        the order records gained the value for an index, so that callers can
+        page through them with offset/limit.
+
+        Returns:
+            The matching records (read-only)
+        """
+        storage = self._storage.get(table, _NO_RECORDS)
+        field_index = self._indexes.get(table, _NO_INDEXES).get(field)
+        if field_index is None:
+            return [record for record in storage.values() if record.get(field) == value]
+        return [storage[record_id.int] for record_id in field_index.get(value, ())]
 
     async def create_record(self, table: str, data: Dict[str, Any]) -> UUID:
         """
@@ -183,32 +312,61 @@ class InMemoryDB:
         
         This method:
         1. Generates a new UUID for the record
-        2. Acquires table lock for thread safety
-        3. Creates a copy of the data to prevent external modifications
-        4. Stores the record in the database
-        5. Updates all relevant indexes automatically
+        2. Creates a copy of the data to prevent external modifications,
+           interning its string values
+        3. Stores the record in the database
+        4. Updates all relevant indexes automatically
         
         Index Maintenance:
         - Checks all existing indexes for the table
         - Adds new index entries for indexed fields
         - Maintains O(1) lookup time for future queries
         
-        Thread Safety:
-        - Table lock ensures atomic record creation and index updates
-        - Prevents race conditions during concurrent writes
+        Atomicity:
+        - No await between storing the record and updating the indexes, so
+          concurrent coroutines never see one without the other
         """
         record_id = uuid4()
-        async with self._locks[table]:
-            data = data.copy()
+        data = _interned(data)
+        data["id"] = str(record_id)
+        self._storage[table][record_id.int] = data
+        self._versions[table] += 1
+        
+        # Update indexes
+        for field, field_index in self._indexes.get(table, _NO_INDEXES).items():
+            if field in data:
+                _index(field_index, data[field], record_id)
+        
+        return record_id
+
+    async def create_records(
+        self, table: str, records: Iterable[Dict[str, Any]]
+    ) -> List[UUID]:
+        """
+        Create several records in a table at once.
+        
+        Behaves like calling create_record() for each record, but looks up
+        the table storage and indexes once and bumps the table version once
+        for the whole batch.
+        
+        Returns:
+            UUIDs of the created records, in input order
+        """
+        storage = self._storage[table]
+        table_indexes = self._indexes.get(table, _NO_INDEXES)
+        record_ids = []
+        for data in records:
+            record_id = uuid4()
+            data = _interned(data)
             data["id"] = str(record_id)
-            self._storage[table][record_id] = data
-            
-            # Update indexes
-            for field in self._indexes[table]:
+            storage[record_id.int] = data
+            for field, field_index in table_indexes.items():
                 if field in data:
-                    self._indexes[table][field][data[field]].add(record_id)
-            
-            return record_id
+                    _index(field_index, data[field], record_id)
+            record_ids.append(record_id)
+        if record_ids:
+            self._versions[table] += 1
+        return record_ids
 
     async def get_record(self, table: str, record_id: UUID) -> Optional[Dict[str, Any]]:
         """
@@ -216,11 +374,26 @@ class InMemoryDB:
         
         This method:
         1. Returns None if record not found
-        2. Returns a copy of the record data
+        2. Returns the stored record without copying it; the record is
+           read-only and is replaced, not mutated, by later updates
+        """
+        return self._storage.get(table, _NO_RECORDS).get(record_id.int)
+
+    async def get_records(
+        self, table: str, record_ids: Iterable[UUID]
+    ) -> List[Dict[str, Any]]:
         """
-        if record := self._storage[table].get(record_id):
-            return record.copy()
-        return None
+        Get several records by ID.
+        
+        IDs that are not found are skipped. Returns the stored (read-only)
+        records in input order.
+        """
+        storage = self._storage.get(table, _NO_RECORDS)
+        return [
+            record
+            for record_id in record_ids
+            if (record := storage.get(record_id.int)) is not None
+        ]
 
     async def update_record(
         self, table: str, record_id: UUID, data: Dict[str, Any]
@@ -229,16 +402,15 @@ class InMemoryDB:
         Update a record by ID.
         
         This method:
-        1. Acquires table lock for thread safety
-        2. Verifies record exists
-        3. Creates a copy of update data
-        4. Prevents ID field modification
-        5. Updates the record
+        1. Verifies record exists
+        2. Builds the updated record as a new dict (copy-on-write)
+        3. Prevents ID field modification
+        4. Swaps the new record into storage
         
         Index Maintenance:
-        - Removes old index entries before update
-        - Adds new index entries after update
-        - Handles field value changes correctly
+        - Only indexed fields whose value changed are touched
+        - The record moves from the old value's entry to the new one's
+        - Entries left empty are dropped
         - Maintains index consistency
         
         Example:
@@ -247,74 +419,147 @@ class InMemoryDB:
         2. Updates the order record
         3. Adds order to user2's index entry
         
-        Thread Safety:
-        - Table lock ensures atomic update of record and indexes
-        - Prevents inconsistency during concurrent modifications
+        Atomicity:
+        - No await between the existence check, the update and the index
+          maintenance, so concurrent modifications cannot interleave
         """
-        async with self._locks[table]:
-            if record_id not in self._storage[table]:
-                return False
-            
-            # Remove old index entries
-            old_data = self._storage[table][record_id]
-            for field in self._indexes[table]:
-                if field in old_data:
-                    self._indexes[table][field][old_data[field]].discard(record_id)
-            
-            # Update record
-            data = data.copy()
-            if "id" in data:
-                del data["id"]  # Don't allow updating the ID
-            self._storage[table][record_id].update(data)
-            
-            # Add new index entries
-            updated_data = self._storage[table][record_id]
-            for field in self._indexes[table]:
-                if field in updated_data:
-                    self._indexes[table][field][updated_data[field]].add(record_id)
-            
-            return True
+        # Single probe: fetch the record and test for existence at once
+        record = self._storage.get(table, _NO_RECORDS).get(record_id.int)
+        if record is None:
+            return False
+        
+        # Copy-on-write: readers holding the old dict keep a consistent view
+        updated = record | _interned(data)
+        updated["id"] = record["id"]  # Don't allow updating the ID
+        self._storage[table][record_id.int] = updated
+        self._versions[table] += 1
+        
+        # Move index entries only for indexed fields whose value changed.
+        # Fields absent from the update data keep their value, so they are
+        # skipped with a single membership test.
+        for field, field_index in self._indexes.get(table, _NO_INDEXES).items():
+            if field not in data:
+                continue
+            new_value = updated[field]
+            old_value = record.get(field, _MISSING)
+            if new_value is old_value or new_value == old_value:
+                continue
+            if old_value is not _MISSING:
+                _unindex(field_index, old_value, record_id)
+            _index(field_index, new_value, record_id)
+        
+        return True
 
     async def delete_record(self, table: str, record_id: UUID) -> bool:
         """
         Delete a record by ID.
         
         This method:
-        1. Acquires table lock for thread safety
-        2. Verifies record exists
-        3. Removes the record from all indexes
-        4. Deletes the record from storage
+        1. Removes the record from storage if it exists
+        2. Removes the record from all indexes
         
         Index Maintenance:
         - Removes record ID from all relevant index entries
-        - Cleans up index entries to prevent memory leaks
+        - Drops entries left empty to prevent memory leaks
         - Maintains index consistency after deletion
         
-        Thread Safety:
-        - Table lock ensures atomic deletion and index cleanup
-        - Prevents dangling index entries
+        Atomicity:
+        - No await between index cleanup and deletion, which prevents
+          dangling index entries
         """
-        async with self._locks[table]:
-            if record_id not in self._storage[table]:
-                return False
-            
-            # Remove index entries
-            record = self._storage[table][record_id]
-            for field in self._indexes[table]:
+        storage = self._storage.get(table)
+        if storage is None:
+            return False
+        # Single probe: remove the record and test for existence at once
+        record = storage.pop(record_id.int, None)
+        if record is None:
+            return False
+        
+        # Remove index entries
+        for field, field_index in self._indexes.get(table, _NO_INDEXES).items():
+            if field in record:
+                _unindex(field_index, record[field], record_id)
+        
+        self._versions[table] += 1
+        return True
+
+    async def delete_records(self, table: str, record_ids: Iterable[UUID]) -> int:
+        """
+        Delete several records by ID.
+        
+        IDs that are not found are skipped, and the table version is bumped
+        once for the whole batch.
+        
+        Returns:
+            Number of records deleted
+        """
+        storage = self._storage.get(table)
+        if storage is None:
+            return 0
+        table_indexes = self._indexes.get(table, _NO_INDEXES)
+        deleted = 0
+        for record_id in record_ids:
+            record = storage.pop(record_id.int, None)
+            if record is None:
+                continue
+            for field, field_index in table_indexes.items():
                 if field in record:
-                    self._indexes[table][field][record[field]].discard(record_id)
-            
-            # Delete record
-            del self._storage[table][record_id]
-            return True
+                    _unindex(field_index, record[field], record_id)
+            deleted += 1
+        if deleted:
+            self._versions[table] += 1
+        return deleted
 
-    async def list_records(self, table: str) -> List[Dict[str, Any]]:
+    async def list_records(
+        self, table: str, offset: int = 0, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
-        List all records in a table.
+        List records in a table in insertion order.
         
-        Returns copies of records to prevent external modifications.
+        With ``offset``/``limit`` only the requested window is copied; the
+        skipped records are walked past but never materialized.
+        
+        Returns the stored (read-only) records in a new list.
+        """
+        stop = None if limit is None else offset + limit
+        records = self._storage.get(table, _NO_RECORDS).values()
+        return list(islice(records, offset, stop))
+
+    async def count_records(self, table: str) -> int:
+        """Get the number of records in a table."""
+        return len(self._storage.get(table, ()))
+
+    async def snapshot(self, table: str) -> Tuple[Dict[str, Any], ...]:
         """
-        return [record.copy() for record in self._storage[table].values()]
+        Get a read-only snapshot of all records in a table.
+
+        The snapshot is built once per table version and shared by every
+        reader until the next write, so polling a table between writes is
+        O(1) instead of rebuilding the record list on every call.
+
+        Note:
+        - Callers must not modify the records in it; since records are
+          copy-on-write, a snapshot never changes after it is taken
+        """
+        storage = self._storage.get(table)
+        if storage is None:
+            return ()
+        version = self._versions.get(table, 0)
+        cached = self._snapshots.get(table)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        records = tuple(storage.values())
+        self._snapshots[table] = (version, records)
+        return records
+
+    async def table_version(self, table: str) -> int:
+        """
+        Get the version counter of a table.
+
+        The counter is bumped on every write to the table, so callers can
+        cache data derived from it and reuse it while the version is unchanged.
+        """
+        return self._versions.get(table, 0)
 
     async def table_exists(self, table: str) -> bool:
         """Check if a table exists in the database."""
@@ -322,27 +567,34 @@ class InMemoryDB:
 
     async def record_exists(self, table: str, record_id: UUID) -> bool:
         """Check if a record exists by ID."""
-        return record_id in self._storage[table]
+        return record_id.int in self._storage.get(table, _NO_RECORDS)
 
     async def clear_table(self, table: str) -> None:
         """
         Clear all records from a table.
         
         This method:
-        1. Acquires table lock for thread safety
-        2. Removes all records from the table
-        3. Clears all indexes for the table
+        1. Removes all records from the table
+        2. Clears all indexes for the table
         
         Index Maintenance:
         - Removes all index entries for the table
-        - Resets index structures to empty state
+        - Keeps the index definitions so later writes are still indexed
         - Prevents memory leaks from orphaned indexes
         
-        Thread Safety:
-        - Table lock ensures atomic table clearing
-        - Prevents inconsistency between storage and indexes
+        Clearing a table that is already empty does nothing, so it leaves
+        the table version, and everything cached against it, untouched.
+        
+        Atomicity:
+        - Storage and indexes are cleared without an await in between,
+          preventing inconsistency between them
         """
-        async with self._locks[table]:
-            self._storage[table].clear()
-            # Clear all indexes for this table
-            self._indexes[table].clear()
+        storage = self._storage.get(table)
+        if not storage:
+            # Index entries only exist for stored records
+            return
+        storage.clear()
+        self._versions[table] += 1
+        # Clear all index entries for this table
+        for field_index in self._indexes.get(table, _NO_INDEXES).values():
+            field_index.clear()
@@ -19,17 +19,24 @@ rather than models/ to maintain proper separation of concerns:
    - Keeps related functionality together
 """
 
-import json
+from functools import lru_cache
 from pathlib import Path
-from typing import TypedDict, List, Dict
+from typing import List, NotRequired, TypedDict
+
+import orjson
+
+from app.schemas.order import OrderStatus
 
 
 class UserData(TypedDict):
     id: str
     email: str
     full_name: str
-    hashed_password: str
+    age: int
+    is_active: bool
+    hashed_password: NotRequired[str]
     created_at: str
+    updated_at: str
 
 
 class OrderData(TypedDict):
@@ -38,12 +45,24 @@ class OrderData(TypedDict):
     product_name: str
     quantity: int
     total_price: float
+    status: OrderStatus
     created_at: str
+    updated_at: str
+
+
+class SampleData(TypedDict):
+    users: List[UserData]
+    orders: List[OrderData]
+
 
+@lru_cache(maxsize=1)
+def get_sample_data() -> SampleData:
+    """
+    Load sample data from JSON file.
 
-def get_sample_data() -> Dict[str, List[Dict[str, str | int | float]]]:
-    """Load sample data from JSON file."""
+    The file is static, so it is parsed once (with orjson) and the result is
+    shared by every caller; treat it as read-only.
+    """
     json_path = Path(__file__).parent / "sample_data.json"
-    with open(json_path) as f:
-        data: Dict[str, List[Dict[str, str | int | float]]] = json.load(f)
-        return data
+    data: SampleData = orjson.loads(json_path.read_bytes())
+    return data
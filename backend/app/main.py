@@ -8,10 +8,11 @@ This module serves as the entry point for the FastAPI application and handles:
 5. API route registration
 
 The initialization flow is:
-1. Get singleton database instance (InMemoryDB)
+1. Take the shared database (InMemoryDB) and services from app.api.deps
 2. During startup (lifespan context):
+   - Pre-build the OpenAPI schema
    - Clear existing tables
-   - Load sample data from JSON
+   - Load sample data from JSON (unless LOAD_SAMPLE_DATA=0)
    - Make data available for API endpoints
 3. During shutdown:
    - Clean up all tables
@@ -22,29 +23,63 @@ Sample data is loaded during startup because:
 - Properly cleaned up during shutdown
 - Centralizes initialization code
 - Makes startup errors visible immediately
+
+The bundled sample data is not validated on load; the test suite checks
+that every row passes UserIn/OrderIn validation.
 """
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import TYPE_CHECKING, List
 from uuid import UUID
 
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
-from .db.base import InMemoryDB, DatabaseError
-from .db.initial_data import get_sample_data
-from .services.user_service import UserService
-from .services.order_service import OrderService
+from .core.config import settings
+from .db.base import DatabaseError
 from .schemas.user import UserIn
 from .schemas.order import OrderIn
+from app.api.deps import DB, ORDER_SERVICE, USER_SERVICE
 from app.api.main import api_router
-from app.api.v1.utils import router as utils_router
 
-# Get singleton database instance and initialize services
-db = InMemoryDB()
-user_service = UserService(db)
-order_service = OrderService(db)
+if TYPE_CHECKING:
+    from .db.initial_data import SampleData
+
+# Shared database and the service instances the API dependencies hand out;
+# seeding through the same services means each table's caches exist once
+db = DB
+user_service = USER_SERVICE
+order_service = ORDER_SERVICE
+
+
+# The bundled sample data is trusted and already typed as the schemas expect,
+# so it is built without validation; tests validate every row instead
+def sample_users(sample_data: "SampleData") -> List[UserIn]:
+    """Build the sample users, without validation."""
+    return [
+        UserIn.model_construct(
+            email=user_data["email"],
+            full_name=user_data["full_name"],
+            password=user_data.get("hashed_password", "default_password"),
+            is_active=user_data["is_active"],
+        )
+        for user_data in sample_data["users"]
+    ]
+
+
+def sample_orders(sample_data: "SampleData") -> List[OrderIn]:
+    """Build the sample orders, without validation."""
+    return [
+        OrderIn.model_construct(
+            user_id=UUID(order_data["user_id"]),
+            amount=order_data["total_price"],
+            description=order_data["product_name"],
+            status=order_data["status"],
+        )
+        for order_data in sample_data["orders"]
+    ]
 
 
 @asynccontextmanager
@@ -54,10 +89,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
     This lifespan manager handles the complete database lifecycle:
     1. Startup:
+       - Builds and caches the OpenAPI schema
        - Clears any existing data in tables
-       - Loads fresh sample data from JSON
-       - Converts sample data to proper model instances
-       - Inserts data into respective tables
+       - Loads fresh sample data from JSON when settings.LOAD_SAMPLE_DATA is set
+       - Converts sample data to model instances (trusted, so unvalidated)
+       - Inserts data into respective tables, one batch per table
 
     2. Runtime:
        - Database is ready with sample data
@@ -72,34 +108,25 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     initialization and cleanup of the shared database state.
     """
     try:
+        # Build the OpenAPI schema now; FastAPI memoizes it on the app, so
+        # the first /docs or /openapi.json request doesn't pay for the walk
+        app.openapi()
+
         # Initialize database tables through services
         await user_service.clear_table()
         await order_service.clear_table()
 
-        # Load sample data from JSON
-        sample_data = get_sample_data()
-
-        # Insert users through service layer
-        for user_data in sample_data["users"]:
-            # Convert to UserIn schema format
-            user_in = UserIn(
-                email=str(user_data["email"]),
-                full_name=str(user_data["full_name"]),
-                password=str(user_data.get("hashed_password", "default_password")),
-                is_active=bool(user_data.get("is_active", True)),
-            )
-            await user_service.create_user(user_in)
-
-        # Insert orders through service layer
-        for order_data in sample_data["orders"]:
-            # Convert to OrderIn schema format
-            order_in = OrderIn(
-                user_id=UUID(str(order_data["user_id"])),
-                amount=float(order_data["total_price"]),
-                description=str(order_data["product_name"]),
-                status=str(order_data.get("status", "pending")),
-            )
-            await order_service.create_order(order_in)
+        if settings.LOAD_SAMPLE_DATA:
+            # Imported here so the JSON file is never read when seeding is off
+            from .db.initial_data import get_sample_data
+
+            # Load sample data from JSON
+            sample_data = get_sample_data()
+
+            # Insert users and orders through the service layer, one batch per
+            # table
+            await user_service.create_users(sample_users(sample_data))
+            await order_service.create_orders(sample_orders(sample_data))
 
         yield
     finally:
@@ -114,8 +141,15 @@ def create_app() -> FastAPI:
         title="In-Memory DB Service",
         version="1.0.0",
         lifespan=lifespan,
+        # List and dump responses dominate JSON encoding time
+        default_response_class=ORJSONResponse,
     )
 
+    # Expose the shared database on the application state so dependencies
+    # can hand it out by reference. This is set here rather than in the
+    # lifespan so that it is available even when the lifespan is not run.
+    app.state.db = db
+
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
@@ -129,9 +163,9 @@ def create_app() -> FastAPI:
     @app.exception_handler(DatabaseError)
     async def database_error_handler(
         request: Request, exc: DatabaseError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle database errors."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"detail": str(exc)},
         )
@@ -139,16 +173,15 @@ def create_app() -> FastAPI:
     @app.exception_handler(Exception)
     async def general_exception_handler(
         request: Request, exc: Exception
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle all other exceptions."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={"detail": str(exc)},
         )
 
-    # Register API router
+    # Register API router (already includes the utils router)
     app.include_router(api_router)
-    app.include_router(utils_router, prefix="/api/v1/utils")
 
     @app.get("/")
     async def root() -> dict[str, str]:
@@ -1,20 +1,34 @@
 """API schemas for orders."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
-from pydantic import Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
-from .base import BaseSchema
+# Validated by pydantic-core as a Literal, so no Python validator runs
+OrderStatus = Literal[
+    "pending",
+    "processing",
+    "shipped",
+    "delivered",
+    "cancelled",
+    "completed",
+]
 
 
-class OrderBase(BaseSchema):
-    """Base order schema with common attributes"""
+class OrderBase(BaseModel):
+    """Base order schema with common attributes
+
+    This deliberately does not extend BaseSchema: the service stamps the
+    timestamps and the database assigns the ID when an order is stored, so
+    generating them while parsing every request body would be wasted work.
+    OrderOut declares the stored values explicitly.
+    """
 
     amount: float = Field(gt=0, description="Total amount of the order")
     description: str = Field(..., description="Description of the order")
-    status: str = Field(default="pending", description="Status of the order")
+    status: OrderStatus = Field(default="pending", description="Status of the order")
 
 
 class OrderIn(OrderBase):
@@ -22,53 +36,26 @@ class OrderIn(OrderBase):
 
     user_id: UUID = Field(..., description="ID of the user placing the order")
 
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, v: str) -> str:
-        """Validate order status."""
-        allowed_statuses = {
-            "pending",
-            "processing",
-            "shipped",
-            "delivered",
-            "cancelled",
-            "completed",
-        }
-        if v not in allowed_statuses:
-            raise ValueError(f"Status must be one of: {', '.join(allowed_statuses)}")
-        return v
-
-
-class OrderUpdate(BaseSchema):
-    """Schema for order update data with optional fields."""
+
+class OrderUpdate(BaseModel):
+    """Schema for order update data with optional fields.
+
+    Like OrderBase this does not extend BaseSchema: an update payload has no
+    identity or timestamps of its own, so parsing it should not generate a
+    throwaway UUID and timestamps or let clients overwrite them.
+    """
 
     amount: Optional[float] = Field(None, gt=0, description="Total amount of the order")
     description: Optional[str] = Field(None, description="Description of the order")
-    status: Optional[str] = Field(None, description="Status of the order")
-
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, v: Optional[str]) -> Optional[str]:
-        """Validate order status if provided."""
-        if v is None:
-            return v
-
-        allowed_statuses = {
-            "pending",
-            "processing",
-            "shipped",
-            "delivered",
-            "cancelled",
-            "completed",
-        }
-        if v not in allowed_statuses:
-            raise ValueError(f"Status must be one of: {', '.join(allowed_statuses)}")
-        return v
+    status: Optional[OrderStatus] = Field(None, description="Status of the order")
 
 
 class OrderOut(OrderBase):
     """Schema for order output data."""
 
+    # Validated orders are cached by the service and shared between requests
+    model_config = ConfigDict(frozen=True)
+
     id: UUID = Field(..., description="Unique identifier of the order")
     user_id: UUID = Field(..., description="ID of the user who placed the order")
     created_at: datetime = Field(
@@ -79,8 +66,12 @@ class OrderOut(OrderBase):
     )
 
 
-class OrdersOut(BaseSchema):
+class OrdersOut(BaseModel):
     """Schema for listing multiple orders."""
 
     data: List[OrderOut] = Field(..., description="List of orders")
     count: int = Field(..., description="Total number of orders")
+    offset: int = Field(default=0, description="Number of orders skipped")
+    limit: Optional[int] = Field(
+        default=None, description="Maximum number of orders returned"
+    )
@@ -41,6 +41,14 @@ class UserUpdate(BaseModel):
 class UserOut(UserBase):
     """Schema for user output data."""
 
+    # Stored emails were validated and normalised by UserIn / UserUpdate on
+    # the way in, and EmailStr checks dominate the cost of validating a user,
+    # so output records are not re-checked
+    email: str = Field(
+        ...,
+        description="User's email address",
+        json_schema_extra={"format": "email"},
+    )
     id: UUID = Field(..., description="Unique identifier of the user")
     created_at: datetime = Field(..., description="Timestamp when the user was created")
     updated_at: datetime = Field(
@@ -48,6 +56,8 @@ class UserOut(UserBase):
     )
 
     model_config = ConfigDict(
+        # Validated users are cached by the service and shared between requests
+        frozen=True,
         json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
@@ -66,6 +76,10 @@ class UsersOut(BaseModel):
 
     data: List[UserOut] = Field(..., description="List of users")
     count: int = Field(..., description="Total number of users")
+    offset: int = Field(default=0, description="Number of users skipped")
+    limit: Optional[int] = Field(
+        default=None, description="Maximum number of users returned"
+    )
 
 
 # Update exports
@@ -1,17 +1,35 @@
 """Base service class for database operations."""
 
 from uuid import UUID
-from typing import Dict, List, Optional, Any
+from typing import Dict, FrozenSet, List, Optional, Any, Sequence, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
 from app.db.base import InMemoryDB
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 
 class BaseService:
     """Base service class for database operations"""
 
+    # Fields that must never leave the service through table dumps
+    private_fields: FrozenSet[str] = frozenset()
+
     def __init__(self, db: InMemoryDB, table_name: str):
         """Initialize service with database instance and table name"""
         self.db = db
         self.table_name = table_name
+        # Last dump projection, keyed by the table version it was built from
+        self._dump_cache: Optional[Tuple[int, Sequence[Dict[str, Any]]]] = None
+        # Last validated list per model type: {model: (table version, models)}
+        self._model_cache: Dict[Type[BaseModel], Tuple[int, List[Any]]] = {}
+        # Validated models per model type and stored record:
+        # {model: {id(record): (record, validated)}}. Holding the record keeps
+        # its id() from being reused while cached.
+        self._record_models: Dict[
+            Type[BaseModel], Dict[int, Tuple[Dict[str, Any], Any]]
+        ] = {}
 
     async def create(self, data: Dict[str, Any]) -> UUID:
         """Create a new record in the database"""
@@ -19,11 +37,9 @@ class BaseService:
 
     async def get(self, record_id: UUID) -> Optional[Dict[str, Any]]:
         """Get a record by ID"""
-        record = await self.db.get_record(self.table_name, record_id)
-        if record is not None:
-            record = record.copy()
-            record["id"] = str(record_id)
-        return record
+        # The DB stores the string form of the ID at insert time, so no
+        # per-call conversion is needed. The record is read-only.
+        return await self.db.get_record(self.table_name, record_id)
 
     async def update(self, record_id: UUID, data: Dict[str, Any]) -> bool:
         """Update a record by ID"""
@@ -33,12 +49,78 @@ class BaseService:
         """Delete a record by ID"""
         return await self.db.delete_record(self.table_name, record_id)
 
-    async def list(self) -> List[Dict[str, Any]]:
-        """List all records in the table"""
-        records = await self.db.list_records(self.table_name)
-        for record in records:
-            record["id"] = str(record["id"]) if "id" in record else None
-        return records
+    async def list(
+        self, offset: int = 0, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """List records in the table, optionally a single page of them"""
+        return await self.db.list_records(self.table_name, offset, limit)
+
+    async def count(self) -> int:
+        """Count the records in the table"""
+        return await self.db.count_records(self.table_name)
+
+    async def dump(self) -> Sequence[Dict[str, Any]]:
+        """
+        Dump all records in the table for table-level operations.
+
+        Records are returned as plain dicts with private fields stripped, so
+        they can be encoded directly without a Pydantic round-trip. The
+        projection is cached until the table is written to again; callers
+        must treat the returned records as read-only.
+        """
+        records = await self.db.snapshot(self.table_name)
+        private_fields = self.private_fields
+        if not private_fields:
+            return records
+
+        version = await self.db.table_version(self.table_name)
+        if self._dump_cache is not None and self._dump_cache[0] == version:
+            return self._dump_cache[1]
+        projected = [
+            {k: v for k, v in record.items() if k not in private_fields}
+            for record in records
+        ]
+        self._dump_cache = (version, projected)
+        return projected
+
+    async def version(self) -> int:
+        """Get the table version, which changes on every write to the table"""
+        return await self.db.table_version(self.table_name)
+
+    async def list_models(
+        self, model: Type[ModelT], offset: int = 0, limit: Optional[int] = None
+    ) -> List[ModelT]:
+        """
+        List records in the table validated as ``model``.
+
+        Records were already validated on the way in, so the validated list is
+        cached until the table is written to again instead of re-running
+        Pydantic over every record on each call. Lists are cached per model
+        type, and pages are sliced from the cached list.
+
+        When the list is rebuilt, only records written since the last build
+        are validated. Writes replace the stored dict rather than mutating
+        it, so a record that is still the same object is unchanged and its
+        model is reused.
+        """
+        version = await self.db.table_version(self.table_name)
+        cached_list = self._model_cache.get(model)
+        if cached_list is not None and cached_list[0] == version:
+            models = cached_list[1]
+        else:
+            records = await self.db.snapshot(self.table_name)
+            previous = self._record_models.get(model, {})
+            record_models: Dict[int, Tuple[Dict[str, Any], Any]] = {}
+            models = []
+            for record in records:
+                cached = previous.get(id(record))
+                item = model.model_validate(record) if cached is None else cached[1]
+                record_models[id(record)] = (record, item)
+                models.append(item)
+            self._record_models[model] = record_models
+            self._model_cache[model] = (version, models)
+        stop = None if limit is None else offset + limit
+        return models[offset:stop]
 
     async def exists(self, record_id: UUID) -> bool:
         """Check if a record exists by ID"""
@@ -1,7 +1,7 @@
 """Service layer for handling order-related operations."""
 
-from typing import List, Dict, Any
-from uuid import UUID, uuid4
+from typing import List, Dict, Any, Optional
+from uuid import UUID
 from datetime import datetime, UTC
 
 from app.db.base import InMemoryDB, RecordNotFoundError, DatabaseError
@@ -17,11 +17,9 @@ class OrderService(BaseService):
 
     async def create_order(self, order_data: OrderIn) -> OrderOut:
         """Create a new order"""
-        # Create order dict with generated fields
-        order_dict = order_data.model_dump()
-        order_dict["id"] = str(
-            uuid4()
-        )  # Store ID as string since that's what DB expects
+        # Create order dict with generated fields. The input schema is flat, so
+        # dict() copies its field values without model_dump()'s serializer pass
+        order_dict = dict(order_data)
         now = datetime.now(UTC)
         order_dict["created_at"] = now
         order_dict["updated_at"] = now
@@ -33,6 +31,22 @@ class OrderService(BaseService):
             raise DatabaseError("Failed to retrieve created order")
         return OrderOut(**stored_order)
 
+    async def create_orders(self, orders_data: List[OrderIn]) -> List[OrderOut]:
+        """Create several orders in one database call"""
+        now = datetime.now(UTC)
+        order_dicts = []
+        for order_data in orders_data:
+            order_dict = dict(order_data)
+            order_dict["created_at"] = now
+            order_dict["updated_at"] = now
+            order_dicts.append(order_dict)
+
+        record_ids = await self.db.create_records(self.table_name, order_dicts)
+        stored_orders = await self.db.get_records(self.table_name, record_ids)
+        if len(stored_orders) != len(record_ids):
+            raise DatabaseError("Failed to retrieve created orders")
+        return [OrderOut(**order) for order in stored_orders]
+
     async def get_order(self, order_id: UUID) -> OrderOut:
         """Get an order by ID"""
         order = await self.db.get_record(self.table_name, order_id)
@@ -44,22 +58,14 @@ class OrderService(BaseService):
         self, order_id: UUID, order_data: Dict[str, Any]
     ) -> OrderOut:
         """Update an order's data"""
-        # Get current order data
-        current_order = await self.db.get_record(self.table_name, order_id)
-        if not current_order:
-            raise RecordNotFoundError(f"Order with ID {order_id} not found")
-
-        # Update with new data
+        # Only the changed fields are sent: the store merges them into the
+        # current record itself and re-indexes just those fields
         update_data = {k: v for k, v in order_data.items() if v is not None}
-        order_dict = {
-            **current_order,
-            **update_data,
-            "updated_at": datetime.now(UTC),
-        }
+        update_data["updated_at"] = datetime.now(UTC)
 
-        success = await self.db.update_record(self.table_name, order_id, order_dict)
+        success = await self.db.update_record(self.table_name, order_id, update_data)
         if not success:
-            raise DatabaseError(f"Failed to update order with ID {order_id}")
+            raise RecordNotFoundError(f"Order with ID {order_id} not found")
 
         # Fetch and return updated order
         updated_order = await self.db.get_record(self.table_name, order_id)
@@ -74,28 +80,44 @@ class OrderService(BaseService):
             raise RecordNotFoundError(f"Order with ID {order_id} not found")
         return True
 
-    async def list_orders(self, bulk_mode: bool = False) -> List[OrderOut]:
+    async def list_orders(
+        self, bulk_mode: bool = False, offset: int = 0, limit: Optional[int] = None
+    ) -> List[OrderOut]:
         """
-        List all orders.
+        List orders, optionally a single page of them.
 
         Args:
             bulk_mode: If True, uses optimized bulk retrieval (Note: base DB doesn't support this yet)
+            offset: Number of orders to skip
+            limit: Maximum number of orders to return (all if None)
         """
-        orders = await self.db.list_records(self.table_name)
-        return [OrderOut.model_validate(order) for order in orders]
+        return await self.list_models(OrderOut, offset, limit)
 
     async def get_user_orders(
-        self, user_id: UUID, bulk_mode: bool = False
+        self,
+        user_id: UUID,
+        bulk_mode: bool = False,
+        offset: int = 0,
+        limit: Optional[int] = None,
     ) -> List[OrderOut]:
         """
-        Get all orders for a specific user.
+        Get orders for a specific user, optionally a single page of them.
+
+        Uses the ``orders.user_id`` hash index maintained by the database, so
+        the lookup touches only the user's orders instead of scanning the
+        whole table. Only the requested page is validated. Orders come back
+        in the order they were created, as with a scan of the table.
 
         Args:
             user_id: The user ID to filter orders by
             bulk_mode: If True, uses optimized bulk retrieval (Note: base DB doesn't support this yet)
+            offset: Number of orders to skip
+            limit: Maximum number of orders to return (all if None)
         """
-        orders = await self.db.list_records(self.table_name)
-        user_orders = [
-            order for order in orders if str(order.get("user_id")) == str(user_id)
-        ]
-        return [OrderOut.model_validate(order) for order in user_orders]
+        orders = await self.db.list_by(self.table_name, "user_id", user_id)
+        stop = None if limit is None else offset + limit
+        return [OrderOut.model_validate(order) for order in orders[offset:stop]]
+
+    async def count_user_orders(self, user_id: UUID) -> int:
+        """Count the orders placed by a specific user"""
+        return await self.db.count_by_index(self.table_name, "user_id", user_id)
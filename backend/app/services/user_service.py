@@ -1,5 +1,5 @@
-from typing import List
-from uuid import UUID, uuid4
+from typing import List, Optional
+from uuid import UUID
 from datetime import datetime
 
 from app.db.base import InMemoryDB, RecordNotFoundError, DatabaseError
@@ -10,18 +10,19 @@ from .base_service import BaseService
 class UserService(BaseService):
     """Service layer for handling user-related operations"""
 
+    private_fields = frozenset({"hashed_password"})
+
     def __init__(self, db: InMemoryDB):
         super().__init__(db, "users")
 
     async def create_user(self, user_data: UserIn) -> UserOut:
         """Create a new user"""
-        # Create user dict with generated fields
-        user_dict = user_data.model_dump()
-        user_dict["id"] = str(
-            uuid4()
-        )  # Store ID as string since that's what DB expects
-        user_dict["created_at"] = datetime.utcnow()
-        user_dict["updated_at"] = datetime.utcnow()
+        # Create user dict with generated fields. The input schema is flat, so
+        # dict() copies its field values without model_dump()'s serializer pass
+        user_dict = dict(user_data)
+        now = datetime.utcnow()
+        user_dict["created_at"] = now
+        user_dict["updated_at"] = now
         user_dict["hashed_password"] = (
             f"hashed_{user_dict['password']}"  # TODO: Implement proper hashing
         )
@@ -34,6 +35,25 @@ class UserService(BaseService):
             raise DatabaseError("Failed to retrieve created user")
         return UserOut(**stored_user)
 
+    async def create_users(self, users_data: List[UserIn]) -> List[UserOut]:
+        """Create several users in one database call"""
+        now = datetime.utcnow()
+        user_dicts = []
+        for user_data in users_data:
+            user_dict = dict(user_data)
+            user_dict["created_at"] = now
+            user_dict["updated_at"] = now
+            user_dict["hashed_password"] = (
+                f"hashed_{user_dict.pop('password')}"  # TODO: Implement proper hashing
+            )
+            user_dicts.append(user_dict)
+
+        record_ids = await self.db.create_records(self.table_name, user_dicts)
+        stored_users = await self.db.get_records(self.table_name, record_ids)
+        if len(stored_users) != len(record_ids):
+            raise DatabaseError("Failed to retrieve created users")
+        return [UserOut(**user) for user in stored_users]
+
     async def get_user(self, user_id: UUID) -> UserOut:
         """Get a user by ID"""
         user = await self.db.get_record(self.table_name, user_id)
@@ -41,25 +61,26 @@ class UserService(BaseService):
             raise RecordNotFoundError(f"User with ID {user_id} not found")
         return UserOut(**user)
 
+    async def get_users(self, user_ids: List[UUID]) -> List[UserOut]:
+        """Get several users by ID, skipping IDs that are not found"""
+        users = await self.db.get_records(self.table_name, user_ids)
+        return [UserOut(**user) for user in users]
+
     async def update_user(self, user_id: UUID, user_data: UserUpdate) -> UserOut:
         """Update a user's data"""
-        # Get current user data
-        current_user = await self.db.get_record(self.table_name, user_id)
-        if not current_user:
-            raise RecordNotFoundError(f"User with ID {user_id} not found")
-
-        # Update with new data
+        # Only the changed fields are sent: the store merges them into the
+        # current record itself and re-indexes just those fields
         update_data = user_data.model_dump(exclude_unset=True, exclude_none=True)
         if "password" in update_data:
             update_data["hashed_password"] = (
                 f"hashed_{update_data['password']}"  # TODO: Implement proper hashing
             )
             del update_data["password"]
+        update_data["updated_at"] = datetime.utcnow()
 
-        user_dict = {**current_user, **update_data, "updated_at": datetime.utcnow()}
-        success = await self.db.update_record(self.table_name, user_id, user_dict)
+        success = await self.db.update_record(self.table_name, user_id, update_data)
         if not success:
-            raise DatabaseError(f"Failed to update user with ID {user_id}")
+            raise RecordNotFoundError(f"User with ID {user_id} not found")
 
         # Fetch and return updated user
         updated_user = await self.db.get_record(self.table_name, user_id)
@@ -74,12 +95,19 @@ class UserService(BaseService):
             raise RecordNotFoundError(f"User with ID {user_id} not found")
         return True
 
-    async def list_users(self, bulk_mode: bool = False) -> List[UserOut]:
+    async def delete_users(self, user_ids: List[UUID]) -> int:
+        """Delete several users by ID and return how many were deleted"""
+        return await self.db.delete_records(self.table_name, user_ids)
+
+    async def list_users(
+        self, bulk_mode: bool = False, offset: int = 0, limit: Optional[int] = None
+    ) -> List[UserOut]:
         """
-        List all users.
+        List users, optionally a single page of them.
 
         Args:
             bulk_mode: If True, uses optimized bulk retrieval (Note: base DB doesn't support this yet)
+            offset: Number of users to skip
+            limit: Maximum number of users to return (all if None)
         """
-        users = await self.db.list_records(self.table_name)
-        return [UserOut.model_validate(user) for user in users]
+        return await self.list_models(UserOut, offset, limit)
@@ -75,12 +75,11 @@ def perform_join(
     # Create lookup dictionary for second table
     table2_lookup = {str(record.get(key)): record for record in table2_data}
 
-    # Perform join
+    # Perform join: one lookup per record, merged with the C-level dict union
     for record1 in table1_data:
-        key_val = str(record1.get(key))
-        if key_val in table2_lookup:
-            joined_record = {**record1, **table2_lookup[key_val]}
-            result.append(joined_record)
+        record2 = table2_lookup.get(str(record1.get(key)))
+        if record2 is not None:
+            result.append(record1 | record2)
 
     return result
 
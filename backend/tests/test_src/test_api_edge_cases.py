@@ -230,6 +230,18 @@ def test_dump_nonexistent_table():
     response = client.get("/api/v1/tables/invalid/dump")
     assert response.status_code == 404
 
+def test_raw_dump_nonexistent_table():
+    """
+    Test: Non-existent Table Raw Dump
+    
+    Verifies that:
+    1. Raw dump endpoint only serves the tables exposed by the API
+    2. Returns 404 for unknown table names
+    """
+    response = client.get("/api/v1/db/dump/invalid")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Table invalid not found"
+
 def test_verify_deleted_user(user_id):
     """
     Test: Resource State After Deletion
@@ -466,6 +478,24 @@ def test_update_order_invalid_status():
     response = client.patch(f"/api/v1/orders/{order_id}", json=updated_data)
     assert response.status_code == 422
 
+def test_create_order_invalid_status(user_id):
+    """
+    Test: Invalid Order Status on Create
+    
+    Verifies that:
+    1. API rejects unknown status values when creating an order
+    2. Returns 422 naming the status field
+    """
+    order = {
+        "user_id": user_id,
+        "amount": 100.00,
+        "description": "Test Product",
+        "status": "invalid_status"
+    }
+    response = client.post("/api/v1/orders", json=order)
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][-1] == "status"
+
 def test_update_order_invalid_amount():
     """
     Test: Invalid Order Amount Update
@@ -488,6 +518,31 @@ def test_update_order_invalid_amount():
     response = client.patch(f"/api/v1/orders/{order_id}", json=updated_data)
     assert response.status_code == 422
 
+def test_update_order_ignores_identity_fields():
+    """
+    Test: Order Update With Identity Fields
+    
+    Verifies that:
+    1. API ignores id and created_at in order update payloads
+    2. Order identity and creation time are preserved
+    """
+    response = client.post("/api/v1/users", json=test_user)
+    user_id = response.json()["id"]
+    
+    order_data = {**test_order, "user_id": user_id}
+    created = client.post("/api/v1/orders", json=order_data).json()
+    
+    updated_data = {
+        "id": str(uuid4()),
+        "created_at": "2000-01-01T00:00:00Z",
+        "status": "shipped"
+    }
+    response = client.patch(f"/api/v1/orders/{created['id']}", json=updated_data)
+    assert response.status_code == 200
+    assert response.json()["id"] == created["id"]
+    assert response.json()["created_at"] == created["created_at"]
+    assert response.json()["status"] == "shipped"
+
 def test_delete_order_invalid_uuid():
     """
     Test: Invalid UUID Format for Order Deletion
@@ -554,12 +609,12 @@ def test_dump_table_invalid_format():
     
     Verifies that:
     1. API validates table format parameters
-    2. Returns 400 for invalid format requests
+    2. Returns 422 for invalid format requests
     3. Provides clear error messages
     """
     response = client.get("/api/v1/tables/users/dump?format=invalid")
-    assert response.status_code == 400
-    assert "Invalid format" in response.json()["detail"]
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["query", "format"]
 
 def test_dump_table_concurrent_access(user_id):
     """
@@ -585,4 +640,34 @@ def test_dump_table_concurrent_access(user_id):
             return [r.status_code for r in responses]
     
     status_codes = asyncio.run(make_concurrent_requests())
-    assert all(code == 200 for code in status_codes) 
\ No newline at end of file
+    assert all(code == 200 for code in status_codes)
+
+
+def test_batch_create_orders_unknown_user():
+    """
+    Test: Batch Order Creation With Unknown User
+    
+    Verifies that:
+    1. The whole batch is rejected with 404 if any user does not exist
+    2. Empty batches are rejected during validation
+    """
+    order = {"user_id": str(uuid4()), "amount": 10.0, "description": "Batch order"}
+    response = client.post("/api/v1/orders:batchCreate", json=[order])
+    assert response.status_code == 404
+
+    response = client.post("/api/v1/orders:batchCreate", json=[])
+    assert response.status_code == 422
+
+
+def test_get_missing_record_with_wildcard_if_none_match():
+    """
+    Test: Wildcard Conditional GET on a Missing Record
+    
+    Verifies that:
+    1. If-None-Match: * on an unknown user or order returns 404, not 304
+    """
+    headers = {"If-None-Match": "*"}
+    response = client.get(f"/api/v1/users/{uuid4()}", headers=headers)
+    assert response.status_code == 404
+    response = client.get(f"/api/v1/orders/{uuid4()}", headers=headers)
+    assert response.status_code == 404
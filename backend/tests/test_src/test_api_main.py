@@ -209,4 +209,50 @@ async def test_lifespan():
         # Test that the database is initialized
         response = test_client.get("/api/v1/utils/health-check/")
         assert response.status_code == 200
-        assert response.json() == {"status": "healthy"} 
\ No newline at end of file
+        assert response.json() == {"status": "healthy"}
+
+
+@pytest.mark.asyncio
+async def test_lifespan_sample_data_switch(monkeypatch):
+    """Test lifespan seeds sample data only when LOAD_SAMPLE_DATA is set."""
+    from app import main
+    from app.core.config import Settings
+
+    test_app = FastAPI(lifespan=lifespan)
+
+    async with lifespan(test_app):
+        assert await user_service.count() > 0
+        assert await order_service.count() > 0
+
+    monkeypatch.setattr(main, "settings", Settings(LOAD_SAMPLE_DATA=False))
+    async with lifespan(test_app):
+        assert await user_service.count() == 0
+        assert await order_service.count() == 0
+
+
+@pytest.mark.asyncio
+async def test_lifespan_uses_dependency_services():
+    """Test seeding and request handling share one service per table."""
+    from app.api.deps import get_order_service, get_user_service
+
+    assert await get_user_service() is user_service
+    assert await get_order_service() is order_service
+    assert user_service.db is db
+
+
+def test_sample_data_passes_validation():
+    """Test every bundled sample row is valid, since seeding skips validation."""
+    from app.db.initial_data import get_sample_data
+    from app.main import sample_orders, sample_users
+    from app.schemas.order import OrderIn
+    from app.schemas.user import UserIn
+
+    sample_data = get_sample_data()
+    users = sample_users(sample_data)
+    orders = sample_orders(sample_data)
+    assert len(users) == len(sample_data["users"]) > 0
+    assert len(orders) == len(sample_data["orders"]) > 0
+    for user in users:
+        assert UserIn.model_validate(dict(user)) == user
+    for order in orders:
+        assert OrderIn.model_validate(dict(order)) == order
@@ -2,6 +2,7 @@ import pytest
 import json
 import os
 from starlette.testclient import TestClient
+from app.api import http_cache
 from app.main import app
 
 """
@@ -266,6 +267,7 @@ def test_dump_table(user_id):
     assert len(result["data"]) > 0
     assert result["count"] > 0
     assert any(user["id"] == user_id for user in result["data"])
+    assert all("hashed_password" not in user for user in result["data"])
 
 def test_list_orders(user_id, order_id, sample_order_data):
     """
@@ -296,6 +298,8 @@ def test_list_orders(user_id, order_id, sample_order_data):
     assert "data" in orders_response
     assert "count" in orders_response
     assert orders_response["count"] >= 3  # At least 3 orders (1 from fixture + 2 new)
+    # The page wrapper carries no per-render id or timestamps
+    assert set(orders_response) == {"data", "count", "offset", "limit"}
     orders = orders_response["data"]
     assert len(orders) >= 3
     print("Debug: Order listing test completed successfully")
@@ -373,4 +377,183 @@ def test_readiness_check():
     assert response.status_code == 200
     data = response.json()
     assert "status" in data
-    assert data["status"] == "ready" 
\ No newline at end of file
+    assert data["status"] == "ready"
+
+
+def test_list_users_pagination(user_id):
+    """
+    Test: User Listing Pagination
+    
+    Verifies that:
+    1. limit and offset select a single page of users
+    2. count reports the total number of users, not the page size
+    3. Out-of-range page sizes are rejected
+    """
+    client.post("/api/v1/users", json=test_user)
+    response = client.get("/api/v1/users", params={"limit": 1, "offset": 1})
+    assert response.status_code == 200
+    page = response.json()
+    assert len(page["data"]) == 1
+    assert page["count"] >= 2
+    assert page["limit"] == 1
+    assert page["offset"] == 1
+
+    response = client.get("/api/v1/users", params={"limit": 501})
+    assert response.status_code == 422
+
+
+def test_batch_user_operations():
+    """
+    Test: Batch User Operations
+    
+    Verifies that:
+    1. Several users can be created in one request
+    2. Several users can be fetched by ID in one request
+    3. Several users can be deleted in one request
+    """
+    users = [
+        {"email": f"batch{i}@example.com", "full_name": f"Batch {i}", "password": "password123"}
+        for i in range(3)
+    ]
+    response = client.post("/api/v1/users:batchCreate", json=users)
+    assert response.status_code == 201
+    created = response.json()
+    assert created["count"] == 3
+    user_ids = [user["id"] for user in created["data"]]
+    assert [user["email"] for user in created["data"]] == [u["email"] for u in users]
+
+    response = client.post("/api/v1/users:batchGet", json=user_ids[:2])
+    assert response.status_code == 200
+    assert [user["id"] for user in response.json()["data"]] == user_ids[:2]
+
+    response = client.post("/api/v1/users:batchDelete", json=user_ids)
+    assert response.status_code == 200
+    assert response.json() == 3
+    assert client.post("/api/v1/users:batchGet", json=user_ids).json()["count"] == 0
+
+
+def test_list_users_conditional_get(user_id):
+    """
+    Test: Conditional GET on User Listing
+    
+    Verifies that:
+    1. Listing returns an ETag and Cache-Control header
+    2. A matching If-None-Match returns 304 with no body
+    3. A write to the table changes the ETag
+    """
+    response = client.get("/api/v1/users")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "no-cache" in response.headers["cache-control"]
+
+    response = client.get("/api/v1/users", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    client.post("/api/v1/users", json=test_user)
+    response = client.get("/api/v1/users", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_get_user_conditional_get(user_id):
+    """
+    Test: Conditional GET on a Single User
+    
+    Verifies that:
+    1. Fetching a user returns an ETag
+    2. A matching If-None-Match returns 304 with no body
+    3. Updating the user changes the ETag and returns the new data
+    """
+    response = client.get(f"/api/v1/users/{user_id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = client.get(f"/api/v1/users/{user_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    client.patch(f"/api/v1/users/{user_id}", json={"full_name": "Renamed User"})
+    response = client.get(f"/api/v1/users/{user_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert response.json()["full_name"] == "Renamed User"
+
+
+def test_conditional_get_weak_etag(user_id):
+    """
+    Test: Conditional GET with a Weakened ETag
+    
+    Verifies that:
+    1. An ETag a proxy prefixed with W/ still matches
+    2. The match works for lists and single records
+    """
+    for url in ("/api/v1/users", f"/api/v1/users/{user_id}"):
+        etag = client.get(url).headers["etag"]
+        response = client.get(url, headers={"If-None-Match": f"W/{etag}"})
+        assert response.status_code == 304
+
+
+def test_single_records_do_not_evict_list_pages(user_id):
+    """
+    Test: Body Cache Separation
+    
+    Verifies that:
+    1. Reading many single users leaves the cached list page in place
+    """
+    user_ids = [
+        client.post("/api/v1/users", json=test_user).json()["id"]
+        for _ in range(http_cache.MAX_CACHED_BODIES + 1)
+    ]
+    etag = client.get("/api/v1/users").headers["etag"]
+    for new_id in user_ids:
+        assert client.get(f"/api/v1/users/{new_id}").status_code == 200
+    assert etag in http_cache._bodies
+    assert len(http_cache._record_bodies) == http_cache.MAX_CACHED_BODIES
+
+
+def test_get_user_orders_in_creation_order(user_id):
+    """
+    Test: User-Orders Ordering
+    
+    Verifies that:
+    1. A user's orders are listed in the order they were created
+    2. The order is the same on repeated requests
+    """
+    order_ids = []
+    for i in range(8):
+        order_data = {**test_order, "user_id": user_id, "description": f"Item {i}"}
+        response = client.post("/api/v1/orders", json=order_data)
+        assert response.status_code == 201
+        order_ids.append(response.json()["id"])
+
+    for _ in range(2):
+        response = client.get(f"/api/v1/users/{user_id}/orders")
+        assert response.status_code == 200
+        assert [order["id"] for order in response.json()["data"]] == order_ids
+
+
+def test_get_user_orders_pages_are_stable(user_id):
+    """
+    Test: User-Orders Pagination
+    
+    Verifies that:
+    1. offset/limit pages follow creation order
+    2. A new order is appended to the last page and leaves earlier pages unchanged
+    """
+    order_ids = []
+    for i in range(8):
+        order_data = {**test_order, "user_id": user_id, "description": f"Item {i}"}
+        order_ids.append(client.post("/api/v1/orders", json=order_data).json()["id"])
+
+    url = f"/api/v1/users/{user_id}/orders"
+    first = client.get(url, params={"offset": 0, "limit": 4}).json()["data"]
+    assert [order["id"] for order in first] == order_ids[:4]
+
+    new_order = {**test_order, "user_id": user_id, "description": "New item"}
+    order_ids.append(client.post("/api/v1/orders", json=new_order).json()["id"])
+
+    second = client.get(url, params={"offset": 4, "limit": 4}).json()["data"]
+    assert [order["id"] for order in second] == order_ids[4:8]
+    last = client.get(url, params={"offset": 8, "limit": 4}).json()["data"]
+    assert [order["id"] for order in last] == order_ids[8:]
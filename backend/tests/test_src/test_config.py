@@ -1,3 +1,5 @@
+import pytest
+from pydantic import ValidationError
 from app.core.config import Settings
 
 def test_settings_defaults():
@@ -9,4 +11,11 @@ def test_settings_defaults():
     assert settings.SERVICE_NAME == "In-Memory Database Service"
     assert settings.SERVICE_VERSION == "1.0.0"
     assert settings.SERVICE_DESCRIPTION == "A FastAPI service providing in-memory database operations"
-    assert settings.BACKEND_CORS_ORIGINS == ["http://localhost", "http://localhost:8000"]
\ No newline at end of file
+    assert settings.BACKEND_CORS_ORIGINS == ["http://localhost", "http://localhost:8000"]
+
+
+def test_settings_frozen():
+    """Test settings are immutable"""
+    settings = Settings()
+    with pytest.raises(ValidationError):
+        settings.DEBUG = False
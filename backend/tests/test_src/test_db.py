@@ -1,6 +1,7 @@
 import pytest
 from uuid import uuid4
 import asyncio
+import sys
 from collections import defaultdict
 
 from app.db.base import InMemoryDB, DatabaseError
@@ -21,8 +22,7 @@ async def db():
 async def test_db_initialization(db):
     """Test database initialization"""
     assert isinstance(db._storage, defaultdict)
-    assert isinstance(db._locks, defaultdict)
-    assert isinstance(db._indexes, defaultdict)
+    assert isinstance(db._indexes, dict)
     
     # Check that indexes are created for common fields
     assert "orders" in db._indexes
@@ -192,4 +192,167 @@ async def test_db_sample_data(db):
     users = await db.list_records("users")
     orders = await db.list_records("orders")
     assert len(users) == len(sample_data["users"])
-    assert len(orders) == len(sample_data["orders"]) 
\ No newline at end of file
+    assert len(orders) == len(sample_data["orders"]) 
+
+@pytest.mark.asyncio
+async def test_db_index_maintained_after_clear(db):
+    """Test that default indexes keep tracking writes after a table is cleared"""
+    user_id = uuid4()
+    await db.create_record("orders", {"user_id": user_id, "amount": 10})
+    await db.clear_table("orders")
+    assert await db.get_by_index("orders", "user_id", user_id) == set()
+
+    order_id = await db.create_record("orders", {"user_id": user_id, "amount": 20})
+    assert await db.get_by_index("orders", "user_id", user_id) == {order_id}
+
+
+@pytest.mark.asyncio
+async def test_db_snapshot_reused_until_write(db):
+    """Test that table snapshots are shared between writes"""
+    record_id = await db.create_record("users", {"email": "test@example.com"})
+    first = await db.snapshot("users")
+    assert await db.snapshot("users") is first
+
+    await db.update_record("users", record_id, {"email": "new@example.com"})
+    second = await db.snapshot("users")
+    assert second is not first
+    assert first[0]["email"] == "test@example.com"
+    assert second[0]["email"] == "new@example.com"
+
+
+@pytest.mark.asyncio
+async def test_db_list_by(db):
+    """Test listing records by indexed and unindexed fields"""
+    user_id = uuid4()
+    for amount in (10, 20):
+        await db.create_record("orders", {"user_id": user_id, "amount": amount})
+    await db.create_record("orders", {"user_id": uuid4(), "amount": 10})
+
+    by_user = await db.list_by("orders", "user_id", user_id)
+    assert sorted(order["amount"] for order in by_user) == [10, 20]
+    assert await db.list_by("orders", "user_id", uuid4()) == []
+
+    by_amount = await db.list_by("orders", "amount", 10)
+    assert len(by_amount) == 2
+
+
+@pytest.mark.asyncio
+async def test_db_list_records_window(db):
+    """Test listing a window of records and counting a table"""
+    for i in range(5):
+        await db.create_record("test_table", {"n": i})
+
+    assert await db.count_records("test_table") == 5
+    assert await db.count_records("missing_table") == 0
+    page = await db.list_records("test_table", offset=1, limit=2)
+    assert [record["n"] for record in page] == [1, 2]
+    assert len(await db.list_records("test_table", offset=3)) == 2
+
+
+@pytest.mark.asyncio
+async def test_db_batch_operations(db):
+    """Test creating, getting and deleting records in batches"""
+    user_id = uuid4()
+    record_ids = await db.create_records(
+        "orders", [{"user_id": user_id, "amount": amount} for amount in (10, 20)]
+    )
+    assert len(record_ids) == 2
+    assert len(await db.get_by_index("orders", "user_id", user_id)) == 2
+    assert await db.count_by_index("orders", "user_id", user_id) == 2
+
+    records = await db.get_records("orders", [record_ids[1], uuid4(), record_ids[0]])
+    assert [record["amount"] for record in records] == [20, 10]
+
+    assert await db.delete_records("orders", [record_ids[0], uuid4()]) == 1
+    assert await db.get_by_index("orders", "user_id", user_id) == {record_ids[1]}
+    assert await db.create_records("orders", []) == []
+
+
+@pytest.mark.asyncio
+async def test_db_reads_do_not_create_entries(db):
+    """Test that reading unknown tables or values leaves the store unchanged"""
+    assert await db.get_record("ghost", uuid4()) is None
+    assert await db.list_records("ghost") == []
+    assert await db.snapshot("ghost") == ()
+    assert await db.record_exists("ghost", uuid4()) is False
+    assert await db.update_record("ghost", uuid4(), {"a": 1}) is False
+    assert await db.delete_record("ghost", uuid4()) is False
+    assert await db.table_exists("ghost") is False
+
+    assert await db.get_by_index("orders", "user_id", uuid4()) == set()
+    assert await db.list_by("orders", "user_id", uuid4()) == []
+    assert await db.count_by_index("orders", "user_id", uuid4()) == 0
+    assert await db.count_by_index("orders", "amount", 10) == 0
+    assert len(db._indexes["orders"]["user_id"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_db_index_entries_dropped_when_empty(db):
+    """Test that deletes and updates leave no empty index entries behind"""
+    user_id, other_user_id = uuid4(), uuid4()
+    record_id = await db.create_record("orders", {"user_id": user_id})
+
+    await db.update_record("orders", record_id, {"user_id": other_user_id})
+    assert user_id not in db._indexes["orders"]["user_id"]
+    assert await db.get_by_index("orders", "user_id", other_user_id) == {record_id}
+
+    await db.update_record("orders", record_id, {"status": "shipped"})
+    assert await db.get_by_index("orders", "user_id", other_user_id) == {record_id}
+
+    await db.delete_record("orders", record_id)
+    assert len(db._indexes["orders"]["user_id"]) == 0
+
+
+@pytest.mark.asyncio
+async def test_db_update_is_copy_on_write(db):
+    """Test that updates replace records instead of mutating them"""
+    record_id = await db.create_record("test_table", {"name": "Before"})
+    before = await db.get_record("test_table", record_id)
+
+    await db.update_record("test_table", record_id, {"name": "After", "id": "x"})
+    after = await db.get_record("test_table", record_id)
+    assert before["name"] == "Before"
+    assert after["name"] == "After"
+    assert after["id"] == str(record_id)
+
+
+@pytest.mark.asyncio
+async def test_db_index_lookups_are_snapshots(db):
+    """Test that index lookups hand out snapshots unaffected by later writes"""
+    user_id = uuid4()
+    first_id = await db.create_record("orders", {"user_id": user_id})
+    ids = await db.get_by_index("orders", "user_id", user_id)
+    assert isinstance(ids, frozenset)
+
+    second_id = await db.create_record("orders", {"user_id": user_id})
+    assert ids == {first_id}
+    assert await db.get_by_index("orders", "user_id", user_id) == {first_id, second_id}
+
+
+@pytest.mark.asyncio
+async def test_db_interns_string_values(db):
+    """Test that equal string values share one stored object"""
+    status = "".join(["pend", "ing"])
+    first_id = await db.create_record("orders", {"status": status, "total": 1.0})
+    [second_id] = await db.create_records("orders", [{"status": "".join(["pend", "ing"])}])
+    first = await db.get_record("orders", first_id)
+    second = await db.get_record("orders", second_id)
+    assert first["status"] is second["status"]
+
+    await db.update_record("orders", first_id, {"status": "".join(["ship", "ped"])})
+    updated = await db.get_record("orders", first_id)
+    assert updated["status"] is sys.intern("shipped")
+    assert updated["total"] == 1.0
+
+
+@pytest.mark.asyncio
+async def test_db_clear_empty_table_keeps_version(db):
+    """Test that clearing an empty table is a no-op"""
+    await db.clear_table("test_table")
+    assert not await db.table_exists("test_table")
+
+    await db.create_record("test_table", {"n": 1})
+    await db.clear_table("test_table")
+    version = await db.table_version("test_table")
+    await db.clear_table("test_table")
+    assert await db.table_version("test_table") == version
@@ -1,7 +1,9 @@
 import pytest
 from uuid import UUID, uuid4
+from pydantic import BaseModel, ValidationError
 from app.db.base import InMemoryDB
 from app.services.base_service import BaseService
+from app.schemas.user import UserOut
 
 @pytest.fixture
 async def db():
@@ -109,4 +111,84 @@ async def test_base_service_exists(service):
     
     # Test exists
     assert await service.exists(record_id) is True
-    assert await service.exists(uuid4()) is False 
\ No newline at end of file
+    assert await service.exists(uuid4()) is False 
+
+@pytest.mark.asyncio
+async def test_base_service_dump_tracks_writes(service):
+    """Test dump reuses its projection until the table changes"""
+    record_id = await service.create({"name": "Test"})
+    first = await service.dump()
+    assert await service.dump() is first
+
+    await service.update(record_id, {"name": "Updated"})
+    second = await service.dump()
+    assert second is not first
+    assert second[0]["name"] == "Updated"
+
+class _Named(BaseModel):
+    name: str
+
+@pytest.mark.asyncio
+async def test_base_service_list_models_tracks_writes(service):
+    """Test list_models reuses validated models until the table changes"""
+    record_id = await service.create({"name": "Test"})
+    first = await service.list_models(_Named)
+    again = await service.list_models(_Named)
+    assert again is not first
+    assert again[0] is first[0]
+
+    await service.update(record_id, {"name": "Updated"})
+    second = await service.list_models(_Named)
+    assert second[0] is not first[0]
+    assert second[0].name == "Updated"
+
+
+class _Labelled(BaseModel):
+    name: str
+    label: str = "default"
+
+
+@pytest.mark.asyncio
+async def test_base_service_list_models_per_model_type(service):
+    """Test list_models caches each model type separately"""
+    await service.create({"name": "Test"})
+    named = await service.list_models(_Named)
+    labelled = await service.list_models(_Labelled)
+    assert type(named[0]) is _Named
+    assert type(labelled[0]) is _Labelled
+    assert (await service.list_models(_Named))[0] is named[0]
+
+
+@pytest.mark.asyncio
+async def test_base_service_list_models_revalidates_changed_records(service):
+    """Test list_models only validates records written since the last build"""
+    first_id = await service.create({"name": "First"})
+    await service.create({"name": "Second"})
+    before = await service.list_models(_Named)
+
+    await service.update(first_id, {"name": "Renamed"})
+    await service.create({"name": "Third"})
+    after = await service.list_models(_Named)
+    assert [item.name for item in after] == ["Renamed", "Second", "Third"]
+    assert after[0] is not before[0]
+    assert after[1] is before[1]
+
+    await service.delete(first_id)
+    remaining = await service.list_models(_Named)
+    assert remaining == after[1:]
+    assert remaining[0] is before[1]
+
+@pytest.mark.asyncio
+async def test_base_service_cached_models_are_frozen(service):
+    """Test that cached output models cannot be modified by a caller"""
+    await service.create({
+        "email": "test@example.com",
+        "full_name": "Test",
+        "is_active": True,
+        "created_at": "2024-03-22T00:00:00Z",
+        "updated_at": "2024-03-22T00:00:00Z",
+    })
+    [user] = await service.list_models(UserOut)
+    with pytest.raises(ValidationError):
+        user.full_name = "Changed"
+    assert (await service.list_models(UserOut))[0].full_name == "Test"